@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Code Nexus - Throughput and Memory Benchmark Suite
+
+Runs every DataProcessor, DataStream and ProcessingPipeline of the three
+exercises on synthetic inputs and reports records/second, per-batch
+latency percentiles and tracemalloc peak memory. Results can be saved as
+a JSON baseline and later runs compared against it to flag regressions.
+
+Usage:
+    python3 benchmark.py [--max-records N] [--batch-size N]
+                         [--only SUBSTRING] [--save FILE]
+                         [--compare FILE] [--tolerance RATIO]
+
+Examples:
+    python3 benchmark.py --max-records 100000
+    python3 benchmark.py --save baseline.json
+    python3 benchmark.py --compare baseline.json --tolerance 0.15
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+SIZES: List[int] = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+LOG_LEVELS: List[str] = ["INFO", "WARN", "ERROR", "DEBUG"]
+EVENTS: List[str] = ["login", "logout", "error"]
+
+
+class Case(NamedTuple):
+    """One benchmark: builds batches for n records and runs one batch."""
+
+    name: str
+    make: Callable[[int, int], List[Any]]
+    run: Callable[[Any], Any]
+
+
+class Measurement(NamedTuple):
+    """Outcome of one case at one input size."""
+
+    records: int
+    seconds: float
+    records_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_bytes: int
+
+
+def load_module(file_path: str, module_name: str) -> ModuleType:
+    """Load an exercise file the same way the testing suite does."""
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {file_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def batched(records: List[Any], size: int) -> List[List[Any]]:
+    """Split records into consecutive batches of at most size items."""
+    return [records[i:i + size] for i in range(0, len(records), size)]
+
+
+def sensor_records(n: int) -> List[str]:
+    """Synthetic sensor readings."""
+    rng = random.Random(42)
+    kinds = ["temp", "humidity", "pressure"]
+    return [f"{kinds[i % 3]}:{rng.uniform(-20.0, 1050.0):.1f}"
+            for i in range(n)]
+
+
+def transaction_records(n: int) -> List[str]:
+    """Synthetic buy/sell operations."""
+    rng = random.Random(43)
+    return [f"{'buy' if i % 2 else 'sell'}:{rng.randint(1, 1000)}"
+            for i in range(n)]
+
+
+def account_records(n: int) -> List[str]:
+    """Synthetic keyed "side:ACCT:N" operations over 10k accounts."""
+    rng = random.Random(44)
+    return [f"{'buy' if i % 2 else 'sell'}:ACC{rng.randrange(10_000)}:"
+            f"{rng.randint(1, 1000)}" for i in range(n)]
+
+
+def event_records(n: int) -> List[str]:
+    """Synthetic system events."""
+    return [EVENTS[i % 3] for i in range(n)]
+
+
+def vocabulary_records(n: int) -> List[str]:
+    """Synthetic events drawn from a long-tailed vocabulary."""
+    rng = random.Random(45)
+    return [f"event_{int(rng.paretovariate(1.1))}" for _ in range(n)]
+
+
+def mixed_records(n: int) -> List[str]:
+    """Interleaved sensor, transaction and event records."""
+    parts = [sensor_records(n // 3 + 1), transaction_records(n // 3 + 1),
+             event_records(n // 3 + 1)]
+    return [parts[i % 3][i // 3] for i in range(n)]
+
+
+def log_lines(n: int) -> List[str]:
+    """Synthetic "LEVEL: message" log lines."""
+    return [f"{LOG_LEVELS[i % 4]}: request {i} handled" for i in range(n)]
+
+
+def json_records(n: int) -> List[Any]:
+    """Synthetic JSON-like sensor records."""
+    return [{"sensor": "temp", "value": i % 40, "unit": "C"}
+            for i in range(n)]
+
+
+def csv_records(n: int) -> List[Any]:
+    """Synthetic CSV rows."""
+    return [f"user{i},login,{i}" for i in range(n)]
+
+
+def stream_records(n: int) -> List[Any]:
+    """Synthetic stream payloads."""
+    return ["Real-time sensor stream"] * n
+
+
+def from_records(
+    make: Callable[[int], List[Any]]
+) -> Callable[[int, int], List[Any]]:
+    """Turn a record generator into a batch builder."""
+    def build(n: int, size: int) -> List[Any]:
+        return batched(make(n), size)
+    return build
+
+
+def sensor_loop_baseline(data_batch: List[Any]) -> str:
+    """The original per-item SensorStream loop, kept as a reference."""
+    readings = 0
+    total_temp = 0.0
+    ntemps = 0
+    for item in data_batch:
+        if isinstance(item, str):
+            if item.startswith("temp:"):
+                total_temp += float(item.split(":")[1])
+                ntemps += 1
+                readings += 1
+            elif (item.startswith("humidity:") or
+                  item.startswith("pressure:")):
+                readings += 1
+    avg = total_temp / ntemps if ntemps else 0.0
+    return (f"Sensor analysis: {readings} readings processed, "
+            f"avg temp: {avg:.1f}°C")
+
+
+def build_cases(ex0: ModuleType, ex1: ModuleType,
+                ex2: ModuleType) -> List[Case]:
+    """Register one case per processor, stream and pipeline."""
+    rng = random.Random(7)
+    numeric = ex0.NumericProcessor("Numeric Processor")
+    text = ex0.TextProcessor("Text Processor")
+    log = ex0.LogProcessor("Log Processor")
+
+    def floats(n: int, size: int) -> List[Any]:
+        return batched([rng.random() for _ in range(n)], size)
+
+    def columns(n: int, size: int) -> List[Any]:
+        return [array("d", b) for b in floats(n, size)]
+
+    def words(n: int, size: int) -> List[Any]:
+        return [" ".join(["nexus"] * len(b))
+                for b in batched([None] * n, size)]
+
+    def logs(n: int, size: int) -> List[Any]:
+        return batched(log_lines(n), size)
+
+    def each(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def run(batch: List[Any]) -> None:
+            for record in batch:
+                func(record)
+        return run
+
+    cases = [
+        Case("ex0.NumericProcessor[list]", floats, numeric.process),
+        Case("ex0.NumericProcessor[array]", columns, numeric.process),
+        Case("ex0.TextProcessor", words, text.process),
+        Case("ex0.LogProcessor.process", logs, each(log.process)),
+        Case("ex0.LogProcessor.ingest", logs, log.ingest),
+    ]
+
+    streams = [
+        (ex1.SensorStream("SENSOR_001"), sensor_records),
+        (ex1.TransactionStream("TRANS_001"), transaction_records),
+        (ex1.EventStream("EVENT_001"), event_records),
+    ]
+    nexus = ex1.StreamProcessor()
+    for stream, make in streams:
+        nexus.add_stream(stream)
+        cases.append(Case(f"ex1.{type(stream).__name__}",
+                          from_records(make), stream.process_batch))
+    cases.append(Case("ex1.SensorStream[baseline loop]",
+                      from_records(sensor_records), sensor_loop_baseline))
+    keyed = ex1.TransactionStream("TRANS_KEYED")
+    cases.append(Case("ex1.TransactionStream[keyed]",
+                      from_records(account_records), keyed.process_batch))
+    vocab = ex1.EventStream("EVENT_VOCAB")
+    cases.append(Case("ex1.EventStream[vocabulary]",
+                      from_records(vocabulary_records), vocab.process_batch))
+    cases.append(Case("ex1.StreamProcessor", from_records(mixed_records),
+                      nexus.process_batch))
+
+    adapters = [
+        (ex2.JSONAdapter("JSON_ADAPTER"), json_records),
+        (ex2.CSVAdapter("CSV_ADAPTER"), csv_records),
+        (ex2.StreamAdapter("STREAM_ADAPTER"), stream_records),
+    ]
+    for pipeline, make in adapters:
+        for stage in (ex2.InputStage(), ex2.TransformStage(),
+                      ex2.OutputStage()):
+            pipeline.add_stage(stage)
+        cases.append(Case(f"ex2.{type(pipeline).__name__}",
+                          from_records(make), each(pipeline.process)))
+        cases.append(Case(f"ex2.{type(pipeline).__name__}.process_batch",
+                          from_records(make), pipeline.process_batch))
+    return cases
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(case: Case, records: int, batch_size: int) -> Measurement:
+    """Time every batch, then re-run under tracemalloc for peak memory."""
+    batches = case.make(records, batch_size)
+    latencies: List[float] = []
+    clock = time.perf_counter
+    start = clock()
+    for batch in batches:
+        t0 = clock()
+        case.run(batch)
+        latencies.append(clock() - t0)
+    elapsed = clock() - start
+
+    tracemalloc.start()
+    for batch in batches:
+        case.run(batch)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return Measurement(
+        records=records,
+        seconds=elapsed,
+        records_per_sec=records / elapsed if elapsed > 0 else 0.0,
+        p50_ms=percentile(latencies, 0.50) * 1000.0,
+        p99_ms=percentile(latencies, 0.99) * 1000.0,
+        peak_bytes=peak,
+    )
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+            tolerance: float) -> List[str]:
+    """List regressions beyond tolerance relative to the baseline."""
+    regressions: List[str] = []
+    for name, sizes in results.items():
+        for size, now in sizes.items():
+            old = baseline.get("results", {}).get(name, {}).get(size)
+            if old is None:
+                continue
+            floor = old["records_per_sec"] * (1.0 - tolerance)
+            if now["records_per_sec"] < floor:
+                regressions.append(
+                    f"{name} @ {size}: {now['records_per_sec']:,.0f} rec/s "
+                    f"< baseline {old['records_per_sec']:,.0f}"
+                )
+            ceiling = old["peak_bytes"] * (1.0 + tolerance)
+            if now["peak_bytes"] > ceiling and now["peak_bytes"] > 1 << 16:
+                regressions.append(
+                    f"{name} @ {size}: peak {now['peak_bytes']:,} B "
+                    f"> baseline {old['peak_bytes']:,} B"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the module05 processors and pipelines.")
+    parser.add_argument("--max-records", type=int, default=SIZES[-1],
+                        help="largest input size to run (default: 1e7)")
+    parser.add_argument("--batch-size", type=int, default=10_000,
+                        help="records per batch (default: 10000)")
+    parser.add_argument("--only", default="",
+                        help="run only cases whose name contains this")
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown (default: 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite and return the process exit status."""
+    args = parse_args(argv)
+    ex0 = load_module("ex0/stream_processor.py", "stream_processor")
+    ex1 = load_module("ex1/data_stream.py", "data_stream")
+    ex2 = load_module("ex2/nexus_pipeline.py", "nexus_pipeline")
+
+    sizes = [n for n in SIZES if n <= args.max_records]
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'case':<32}{'records':>10}{'rec/s':>14}"
+          f"{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>12}")
+    for case in build_cases(ex0, ex1, ex2):
+        if args.only not in case.name:
+            continue
+        for n in sizes:
+            m = measure(case, n, args.batch_size)
+            results.setdefault(case.name, {})[str(n)] = m._asdict()
+            print(f"{case.name:<32}{n:>10}{m.records_per_sec:>14,.0f}"
+                  f"{m.p50_ms:>10.3f}{m.p99_ms:>10.3f}"
+                  f"{m.peak_bytes / 1024:>12,.1f}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "batch_size": args.batch_size,
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions detected:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,113 +1,889 @@
 """Module for foundational data processing in the Code Nexus."""
 
+import array
+import codecs
+import importlib
+import math
+import mmap
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from itertools import islice
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple,
+    Optional, Tuple, Union
+)
+
+
+def _load_numpy() -> Optional[Any]:
+    """Return the numpy module when it is installed, None otherwise."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+_np: Optional[Any] = _load_numpy()
+
+COLUMN_CHUNK: int = 1 << 16
+NUMERIC_FORMATS: frozenset = frozenset("bBhHiIlLqQfd")
+FLOAT_FORMATS: frozenset = frozenset("fd")
+TEXT_CHUNK: int = 1 << 20
+MIN_LOG_SHARD: int = 1 << 20
+
+
+def _as_column(data: Any) -> Optional[memoryview]:
+    """Return a flat buffer view over columnar data, or None."""
+    if isinstance(data, (str, bytes, bytearray, list, tuple)):
+        return None
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    fmt: Any = view.format.lstrip("@")
+    if view.ndim > 1 and view.c_contiguous and fmt in NUMERIC_FORMATS:
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+def _column_format(view: memoryview) -> Optional[str]:
+    """Return the native element format of a 1-D numeric view, if any."""
+    fmt = view.format.lstrip("@")
+    if view.ndim != 1 or fmt not in NUMERIC_FORMATS:
+        return None
+    return fmt
+
+
+def _column_chunks(view: memoryview) -> Iterator[Any]:
+    """Yield fixed-size chunks of a numeric view.
+
+    Chunks are numpy arrays when numpy is available and can sum the
+    format without overflow, memoryview slices otherwise.
+    """
+    fmt = view.format.lstrip("@")
+    if (_np is not None and view.c_contiguous
+            and (fmt in FLOAT_FORMATS or view.itemsize < 8)):
+        values: Any = _np.frombuffer(view, dtype=fmt)
+    else:
+        values = view
+    for start in range(0, len(view), COLUMN_CHUNK):
+        yield values[start:start + COLUMN_CHUNK]
+
+
+def _chunk_sum(chunk: Any) -> Union[int, float]:
+    """Sum one chunk produced by _column_chunks."""
+    if isinstance(chunk, memoryview):
+        return sum(chunk)
+    assert _np is not None
+    if chunk.dtype.kind == "f":
+        return chunk.sum(dtype=_np.float64).item()
+    return chunk.sum(dtype=_np.int64).item()
+
+
+def _column_totals(view: memoryview) -> Tuple[int, Union[int, float]]:
+    """Sum a numeric view in fixed-size chunks."""
+    fmt = view.format.lstrip("@")
+    total: Union[int, float] = 0.0 if fmt in FLOAT_FORMATS else 0
+    for chunk in _column_chunks(view):
+        total += _chunk_sum(chunk)
+    return len(view), total
+
+
+def _read_chunks(source: Any, chunk_size: int) -> Iterator[Any]:
+    """Yield successive str or bytes chunks from a file, mmap or path."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            yield from _read_chunks(handle, chunk_size)
+    elif isinstance(source, mmap.mmap):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif hasattr(source, "read"):
+        chunk = source.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = source.read(chunk_size)
+    else:
+        raise ValueError("Text source must be a path, file object or mmap")
+
+
+def _decoded_chunks(
+    chunks: Iterator[Any], encoding: str, binary: bool
+) -> Iterator[Any]:
+    """Bring chunks to bytes (binary) or str, decoding incrementally."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk.encode(encoding) if binary else chunk
+        elif binary:
+            yield chunk
+        else:
+            yield decoder.decode(chunk)
+    if not binary:
+        yield decoder.decode(b"", True)
+
+
+def _tally_levels(lines: Iterable[Any]) -> Dict[Any, int]:
+    """Count raw level prefixes; lines without a separator count as None."""
+    counts: Dict[Any, int] = {}
+    get = counts.get
+    colon: Any = None
+    for line in lines:
+        if colon is None:
+            colon = b":" if isinstance(line, bytes) else ":"
+        cut = line.find(colon)
+        key = line[:cut] if cut >= 0 else None
+        counts[key] = get(key, 0) + 1
+    return counts
+
+
+def _lines_before(handle: Any, end: int) -> Iterator[bytes]:
+    """Yield lines of a binary file that start before the end offset."""
+    pos = handle.tell()
+    for line in handle:
+        if pos >= end:
+            break
+        pos += len(line)
+        yield line
+
+
+def _tally_range(path: str, start: int, end: int) -> Dict[Any, int]:
+    """Count the log lines that start inside [start, end) of a file."""
+    with open(path, "rb") as handle:
+        if start > 0:
+            handle.seek(start - 1)
+            handle.readline()
+        return _tally_levels(_lines_before(handle, end))
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with log-spaced buckets.
+
+    Each value lands in the bucket ceil(log_gamma(|x|)), so any quantile
+    is returned within a relative error of alpha. Memory grows with the
+    dynamic range of the data, not with the number of values, and two
+    sketches merge exactly by adding their bucket counts.
+    """
+
+    def __init__(self, alpha: float = 0.01) -> None:
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha: float = alpha
+        self.count: int = 0
+        self._gamma: float = (1.0 + alpha) / (1.0 - alpha)
+        self._log_gamma: float = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros: int = 0
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Add a batch of values (a sequence or a numpy chunk)."""
+        if _np is not None and isinstance(values, _np.ndarray):
+            self._update_array(values)
+            return
+        log = math.log
+        log_gamma = self._log_gamma
+        positive = self._positive
+        negative = self._negative
+        for x in values:
+            if x > 0:
+                key = math.ceil(log(x) / log_gamma)
+                positive[key] = positive.get(key, 0) + 1
+            elif x < 0:
+                key = math.ceil(log(-x) / log_gamma)
+                negative[key] = negative.get(key, 0) + 1
+            else:
+                self._zeros += 1
+            self.count += 1
+
+    def _update_array(self, values: Any) -> None:
+        """Vectorized update for numpy arrays."""
+        assert _np is not None
+        values = values.astype(_np.float64, copy=False)
+        positive = values[values > 0]
+        negative = -values[values < 0]
+        for side, buckets in ((positive, self._positive),
+                              (negative, self._negative)):
+            if not side.size:
+                continue
+            keys = _np.ceil(_np.log(side) / self._log_gamma)
+            found, counts = _np.unique(keys.astype(_np.int64),
+                                       return_counts=True)
+            for key, n in zip(found.tolist(), counts.tolist()):
+                buckets[key] = buckets.get(key, 0) + n
+        self._zeros += int(values.size - positive.size - negative.size)
+        self.count += int(values.size)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch with the same alpha into this one."""
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different alpha")
+        for key, n in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + n
+        for key, n in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + n
+        self._zeros += other._zeros
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile q in [0, 1]."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive))
+
+    def _bucket_value(self, key: int) -> float:
+        """Representative value of a bucket, within alpha of its members."""
+        return 2.0 * self._gamma ** key / (self._gamma + 1.0)
+
+
+class StatsAccumulator:
+    """Online, mergeable count/sum/mean/variance/min/max/quantiles.
+
+    Batches are reduced to their own moments and folded in with the
+    parallel form of Welford's update (Chan et al.), which is also how
+    two accumulators from different shards are merged.
+    """
+
+    def __init__(self, alpha: float = 0.01, quantiles: bool = True) -> None:
+        self.count: int = 0
+        self.total: Union[int, float] = 0
+        self.mean: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self._m2: float = 0.0
+        self.sketch: Optional[QuantileSketch] = (
+            QuantileSketch(alpha) if quantiles else None
+        )
+
+    def fresh(self) -> "StatsAccumulator":
+        """Return an empty accumulator configured like this one."""
+        if self.sketch is None:
+            return StatsAccumulator(quantiles=False)
+        return StatsAccumulator(self.sketch.alpha)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of everything seen so far."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+    def add(self, x: float) -> None:
+        """Add one value with the classic Welford step."""
+        self.count += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        if self.sketch is not None:
+            self.sketch.update((x,))
+
+    def update(self, values: Any) -> None:
+        """Add a batch: a list of numbers or a numeric buffer."""
+        column = _as_column(values)
+        chunks = _column_chunks(column) if column is not None else (values,)
+        for chunk in chunks:
+            n = len(chunk)
+            if n == 0:
+                continue
+            total = _chunk_sum(chunk) if column is not None else sum(chunk)
+            mean = total / n
+            if isinstance(chunk, (list, memoryview)):
+                m2 = math.fsum((x - mean) ** 2 for x in chunk)
+                low, high = min(chunk), max(chunk)
+            else:
+                m2 = float(((chunk - mean) ** 2).sum())
+                low, high = chunk.min().item(), chunk.max().item()
+            self._combine(n, total, mean, m2, low, high)
+            if self.sketch is not None:
+                self.sketch.update(chunk)
+
+    def merge(self, other: "StatsAccumulator") -> None:
+        """Fold another accumulator (for example from a shard) into this."""
+        if other.count:
+            self._combine(other.count, other.total, other.mean, other._m2,
+                          other.min, other.max)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile from the sketch."""
+        if self.sketch is None:
+            raise ValueError("Quantile tracking is disabled")
+        return self.sketch.quantile(q)
+
+    def _combine(
+        self,
+        n: int,
+        total: Union[int, float],
+        mean: float,
+        m2: float,
+        low: float,
+        high: float
+    ) -> None:
+        """Combine moments of a disjoint set of n values into this one."""
+        count = self.count + n
+        delta = mean - self.mean
+        self._m2 += m2 + delta * delta * self.count * n / count
+        self.mean += delta * n / count
+        self.count = count
+        self.total += total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+
+class ValidationMode(str, Enum):
+    """How thoroughly a processor checks its input before processing."""
+
+    STRICT = "strict"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class Verdict(NamedTuple):
+    """Structured outcome of a validation pass."""
+
+    ok: bool
+    message: str
+    checked: int = 0
+    cached: bool = False
+
+
+SKIPPED: Verdict = Verdict(True, "Validation skipped")
+
+
+class ProcessResult(ABC):
+    """Raw fields of one process() call, rendered to text on demand."""
+
+    __slots__ = ("processor",)
+
+    def __init__(self, processor: "DataProcessor") -> None:
+        self.processor: "DataProcessor" = processor
+
+    @property
+    def alert(self) -> bool:
+        """Whether the result needs attention; only logs raise alerts."""
+        return False
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Result body, without the processor's output decoration."""
+        pass
+
+    def __str__(self) -> str:
+        """Render through the owning processor's formatting."""
+        return self.processor.render(self)
+
+
+class NumericResult(ProcessResult):
+    """Count, sum and average of a numeric batch."""
+
+    __slots__ = ("count", "total", "avg")
+
+    def __init__(
+        self,
+        processor: "DataProcessor",
+        count: int,
+        total: Union[int, float],
+        avg: float
+    ) -> None:
+        super().__init__(processor)
+        self.count: int = count
+        self.total: Union[int, float] = total
+        self.avg: float = avg
+
+    def describe(self) -> str:
+        """Describe the numeric batch."""
+        return (f"Processed {self.count} numeric values, "
+                f"sum={self.total}, avg={self.avg}")
+
+
+class TextResult(ProcessResult):
+    """Character (or byte) and word counts of a text."""
+
+    __slots__ = ("chars", "words", "unit")
+
+    def __init__(
+        self,
+        processor: "DataProcessor",
+        chars: int,
+        words: int,
+        unit: str = "characters"
+    ) -> None:
+        super().__init__(processor)
+        self.chars: int = chars
+        self.words: int = words
+        self.unit: str = unit
+
+    def describe(self) -> str:
+        """Describe the text counts."""
+        return (f"Processed text: {self.chars} {self.unit}, "
+                f"{self.words} words")
+
+
+class LogResult(ProcessResult):
+    """Level and message of one log entry, with its alert flag."""
+
+    __slots__ = ("level", "message", "_alert")
+
+    def __init__(
+        self,
+        processor: "DataProcessor",
+        level: str,
+        message: str,
+        alert: bool
+    ) -> None:
+        super().__init__(processor)
+        self.level: str = level
+        self.message: str = message
+        self._alert: bool = alert
+
+    @property
+    def alert(self) -> bool:
+        """Whether the entry's level is an alert level."""
+        return self._alert
+
+    def describe(self) -> str:
+        """Describe the log entry."""
+        return f"{self.level} level detected: {self.message}"
 
 
 class DataProcessor(ABC):
     """Abstract base class defining the common processing interface."""
 
-    def __init__(self, name: str) -> None:
-        """Initialize the processor with a name."""
+    def __init__(
+        self,
+        name: str,
+        mode: ValidationMode = ValidationMode.STRICT,
+        sample_every: int = 100,
+        element_type: Optional[type] = None
+    ) -> None:
+        """Initialize the processor with a name and validation policy.
+
+        element_type declares that list inputs hold only elements of that
+        type. inspect() checks lists against it, and once one list has
+        passed, its verdict is cached like a typed buffer's: later lists
+        from the feed are trusted and not inspected again.
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be a positive integer")
         self.name: str = name
+        self.mode: ValidationMode = mode
+        self.sample_every: int = sample_every
+        self.element_type: Optional[type] = element_type
+        self._verdicts: Dict[Hashable, Verdict] = {}
 
     @abstractmethod
-    def process(self, data: Any) -> str:
+    def process(self, data: Any) -> ProcessResult:
         """Abstract method to be implemented by subclasses."""
         pass
 
     @abstractmethod
-    def validate(self, data: Any) -> bool:
-        """Abstract method for data validation."""
+    def inspect(self, data: Any, stride: int) -> Verdict:
+        """Check data, looking at one element out of every stride."""
         pass
 
+    def shape_key(self, data: Any) -> Optional[Hashable]:
+        """Key for inputs whose verdict depends only on their shape.
+
+        Typed buffers declare their element format up front, so a verdict
+        computed for one batch holds for every batch with the same key.
+        Lists only get a key when the processor was given element_type;
+        nothing else can vouch for their contents without a full scan.
+        """
+        if type(data) is list:
+            if self.element_type is None:
+                return None
+            return (list, self.element_type)
+        column = _as_column(data)
+        if column is None:
+            return None
+        return (type(data), column.format, column.ndim)
+
+    def check(self, data: Any) -> Verdict:
+        """Validate data according to the configured mode, silently."""
+        if self.mode is ValidationMode.OFF:
+            return SKIPPED
+        key = self.shape_key(data)
+        if key is not None:
+            cached = self._verdicts.get(key)
+            if cached is not None:
+                return cached
+        if self.mode is ValidationMode.SAMPLED:
+            stride = self.sample_every
+        else:
+            stride = 1
+        verdict = self.inspect(data, stride)
+        if key is not None and verdict.ok:
+            self._verdicts[key] = verdict._replace(cached=True)
+        return verdict
+
+    def validate(self, data: Any) -> bool:
+        """Return whether data passes the configured validation mode."""
+        return self.check(data).ok
+
+    def _process(self, data: Any) -> ProcessResult:
+        """Process data a check() already accepted, without re-checking.
+
+        The built-in processors override this with their process body;
+        the default simply goes through process().
+        """
+        return self.process(data)
+
     def format_output(self, result: str) -> str:
         """Standard formatting for the output string."""
         return f"Output: {result}"
 
+    def render(self, result: ProcessResult) -> str:
+        """Turn a structured result into its display string."""
+        return self.format_output(result.describe())
+
 
 class NumericProcessor(DataProcessor):
     """Processor specialized in numerical data streams."""
 
-    def validate(self, data: Any) -> bool:
-        """Check if data is a list of numbers."""
+    def __init__(
+        self,
+        name: str,
+        mode: ValidationMode = ValidationMode.STRICT,
+        sample_every: int = 100,
+        stats: Optional[StatsAccumulator] = None,
+        element_type: Optional[type] = None
+    ) -> None:
+        """Initialize the processor; stats keeps running totals if given."""
+        if element_type is not None and not issubclass(element_type,
+                                                       (int, float)):
+            raise ValueError("element_type must be int or float")
+        super().__init__(name, mode, sample_every, element_type)
+        self.stats: Optional[StatsAccumulator] = stats
+
+    def inspect(self, data: Any, stride: int) -> Verdict:
+        """Check if data is a list of numbers or a numeric buffer."""
+        column = _as_column(data)
+        if column is not None:
+            if _column_format(column) is None:
+                return Verdict(False, f"Unsupported buffer format "
+                                      f"{column.format!r}")
+            return Verdict(True, "Numeric data verified", 1)
         if not isinstance(data, list):
-            return False
-
-        for x in data:
-            if not isinstance(x, (int, float)):
-                return False
-
-        print("Validation: Numeric data verified")
-        return True
-
-    def process(self, data: Any) -> str:
-        """Process numbers using a classic average calculation."""
+            return Verdict(False, "Expected a list or numeric buffer")
+
+        declared = self.element_type
+        kinds = declared or (int, float)
+        checked = 0
+        for x in islice(data, 0, None, stride):
+            if not isinstance(x, kinds):
+                if declared is None:
+                    reason = f"Non-numeric element {x!r}"
+                else:
+                    reason = f"Element {x!r} is not {declared.__name__}"
+                return Verdict(False, reason, checked)
+            checked += 1
+        return Verdict(True, "Numeric data verified", checked)
+
+    def process(self, data: Any) -> ProcessResult:
+        """Process numbers using a classic average calculation.
+
+        Buffer-protocol inputs (array.array, memoryview, numpy arrays) are
+        summed in columnar chunks without going through a Python list.
+        """
         if not self.validate(data):
             raise ValueError("Numeric data verification failed")
-
-        count = len(data)
-        total = sum(data)
+        return self._process(data)
+
+    def _process(self, data: Any) -> ProcessResult:
+        """Average numbers that already passed validation."""
+        column = _as_column(data)
+        if self.stats is not None:
+            batch = self.stats.fresh()
+            batch.update(data)
+            self.stats.merge(batch)
+            count, total = batch.count, batch.total
+        elif column is not None:
+            count, total = _column_totals(column)
+        else:
+            count = len(data)
+            total = sum(data)
         if count > 0:
             avg = total / count
         else:
             avg = 0.0
 
-        res_str = f"Processed {count} numeric values, sum={total}, avg={avg}"
-        return self.format_output(res_str)
+        return NumericResult(self, count, total, avg)
 
 
 class TextProcessor(DataProcessor):
     """Processor specialized in text data streams."""
 
-    def validate(self, data: Any) -> bool:
+    def inspect(self, data: Any, stride: int) -> Verdict:
         """Check if data is a string."""
         if isinstance(data, str):
-            print("Validation: Text data verified")
-            return True
-        return False
+            return Verdict(True, "Text data verified", 1)
+        return Verdict(False, "Expected a string")
 
-    def process(self, data: Any) -> str:
-        """Process text and return formatted result."""
+    def process(self, data: Any) -> ProcessResult:
+        """Process text and return its character and word counts."""
         if not self.validate(data):
             raise ValueError("Text data verification failed")
+        return self._process(data)
 
+    def _process(self, data: Any) -> ProcessResult:
+        """Count characters and words of validated text."""
         chars = len(data)
         words = len(data.split())
-        res_str = f"Processed text: {chars} characters, {words} words"
-        return self.format_output(res_str)
+        return TextResult(self, chars, words)
+
+    def process_stream(
+        self,
+        source: Any,
+        chunk_size: int = TEXT_CHUNK,
+        binary: bool = False,
+        encoding: str = "utf-8"
+    ) -> ProcessResult:
+        """Count characters and words of a path, file object or mmap.
+
+        The source is read chunk by chunk, so memory stays bounded by
+        chunk_size. A word split across two chunks is counted once. With
+        binary=True the raw bytes are counted and nothing is decoded;
+        words are then separated by ASCII whitespace only.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        chars = 0
+        words = 0
+        in_word = False
+        chunks = _read_chunks(source, chunk_size)
+        for chunk in _decoded_chunks(chunks, encoding, binary):
+            if not chunk:
+                continue
+            chars += len(chunk)
+            words += len(chunk.split())
+            if in_word and not chunk[:1].isspace():
+                words -= 1
+            in_word = not chunk[-1:].isspace()
+
+        return TextResult(self, chars, words,
+                          "bytes" if binary else "characters")
+
+
+class LogSummary(NamedTuple):
+    """Aggregated level counters for a bulk log ingestion."""
+
+    levels: Dict[str, int]
+    alerts: int
+    lines: int
+    rejected: int
 
 
 class LogProcessor(DataProcessor):
     """Processor specialized in log entries with dynamic severity detection."""
 
-    def validate(self, data: Any) -> bool:
-        """Check for log format (Level: Message)."""
-        if isinstance(data, str):
-            if ":" in data:
-                print("Validation: Log entry verified")
-                return True
-        return False
+    ALERT_LEVELS: frozenset = frozenset({"ERROR"})
 
-    def format_output(self, result: str) -> str:
-        """Override to add smart tags using classic conditional logic."""
-        if "ERROR" in result:
+    def inspect(self, data: Any, stride: int) -> Verdict:
+        """Check for log format (Level: Message)."""
+        if not isinstance(data, str):
+            return Verdict(False, "Expected a string")
+        if ":" not in data:
+            return Verdict(False, "Missing 'LEVEL:' separator", 1)
+        return Verdict(True, "Log entry verified", 1)
+
+    def format_output(self, result: str, alert: Optional[bool] = None) -> str:
+        """Override to add smart tags; alert is inferred when not given."""
+        if alert is None:
+            alert = "ERROR" in result
+        if alert:
             tag = "[ALERT]"
         else:
             tag = "[INFO]"
 
         return f"Output: {tag} {result}"
 
-    def process(self, data: Any) -> str:
-        """Process logs and delegate tag logic to format_output."""
+    def render(self, result: ProcessResult) -> str:
+        """Tag from the result's alert flag instead of searching the text."""
+        return self.format_output(result.describe(), result.alert)
+
+    def process(self, data: Any) -> ProcessResult:
+        """Process logs; the alert flag is decided from the level."""
         if not self.validate(data):
             raise ValueError("Log entry verification failed")
+        return self._process(data)
 
+    def _process(self, data: Any) -> ProcessResult:
+        """Split a validated log entry into level and message."""
         level_raw, content = data.split(':', 1)
         level = level_raw.strip().upper()
-
-        res_str = f"{level} level detected: {content.strip()}"
-        return self.format_output(res_str)
+        return LogResult(self, level, content.strip(),
+                         level in self.ALERT_LEVELS)
+
+    def ingest(self, source: Any, workers: int = 1) -> LogSummary:
+        """Count levels over an iterable of lines, a file object or a path.
+
+        Lines are tallied by their raw level prefix and normalized once at
+        the end, so the hot loop performs a single find and slice per
+        line. With a path and workers > 1, the file is split into byte
+        ranges counted in a process pool and the partial counts merged.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            partials = self._tally_file(os.fspath(source), workers)
+        else:
+            partials = [_tally_levels(source)]
+        return self._summarize(partials)
+
+    def _tally_file(self, path: str, workers: int) -> List[Dict[Any, int]]:
+        """Tally a log file, sharding it across processes when useful."""
+        size = os.path.getsize(path)
+        shards = min(workers, size // MIN_LOG_SHARD)
+        if shards <= 1:
+            return [_tally_range(path, 0, size)]
+        step = -(-size // shards)
+        starts = list(range(0, size, step))
+        ends = [min(start + step, size) for start in starts]
+        with ProcessPoolExecutor(max_workers=shards) as pool:
+            return list(pool.map(_tally_range, [path] * len(starts),
+                                 starts, ends))
+
+    def _summarize(self, partials: List[Dict[Any, int]]) -> LogSummary:
+        """Merge raw partial counts into normalized level counters."""
+        levels: Dict[str, int] = {}
+        lines = 0
+        rejected = 0
+        for counts in partials:
+            for raw, n in counts.items():
+                lines += n
+                if raw is None:
+                    rejected += n
+                    continue
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8", "replace")
+                level = raw.strip().upper()
+                levels[level] = levels.get(level, 0) + n
+        alerts = sum(levels.get(level, 0) for level in self.ALERT_LEVELS)
+        return LogSummary(levels, alerts, lines, rejected)
+
+
+Shape = Callable[[Any], bool]
+Route = Tuple[Optional[Shape], DataProcessor]
+
+
+def _is_log_line(item: str) -> bool:
+    """Shape test telling "LEVEL: message" strings apart from free text."""
+    return ":" in item
+
+
+class ProcessorRouter:
+    """Routes mixed inputs to processors through a type dispatch table."""
+
+    def __init__(self) -> None:
+        self._routes: Dict[type, List[Route]] = {}
+        self._resolved: Dict[type, List[Route]] = {}
+        self.unrouted: int = 0
+        self.rejected: int = 0
+
+    @staticmethod
+    def default() -> "ProcessorRouter":
+        """Build a router for the three foundation processors."""
+        router = ProcessorRouter()
+        numeric_types: List[type] = [list, array.array, memoryview]
+        if _np is not None:
+            numeric_types.append(_np.ndarray)
+        router.register(NumericProcessor("Numeric Processor"), numeric_types)
+        router.register(LogProcessor("Log Processor"), [str], _is_log_line)
+        router.register(TextProcessor("Text Processor"), [str])
+        return router
+
+    def register(
+        self,
+        processor: DataProcessor,
+        types: Iterable[type],
+        shape: Optional[Shape] = None
+    ) -> None:
+        """Route items of the given types to processor.
+
+        Routes for one type are tried in registration order; a shape
+        predicate narrows a route to matching items, None accepts all.
+        """
+        for kind in types:
+            self._routes.setdefault(kind, []).append((shape, processor))
+        self._resolved.clear()
+
+    def _candidates(self, kind: type) -> List[Route]:
+        """Routes for a concrete type, resolved once through its MRO."""
+        routes = self._resolved.get(kind)
+        if routes is None:
+            routes = []
+            for base in kind.__mro__:
+                routes.extend(self._routes.get(base, ()))
+            self._resolved[kind] = routes
+        return routes
+
+    def route(self, item: Any) -> Optional[DataProcessor]:
+        """Return the processor for item, or None if nothing accepts it."""
+        for shape, processor in self._candidates(type(item)):
+            if shape is None or shape(item):
+                return processor
+        return None
+
+    def batches(
+        self, items: Iterable[Any], batch_size: int = 1024
+    ) -> Iterator[Tuple[Optional[DataProcessor], List[Any]]]:
+        """Group items into per-processor micro-batches of batch_size.
+
+        Unroutable items are grouped under None.
+        """
+        pending: Dict[Optional[DataProcessor], List[Any]] = {}
+        for item in items:
+            processor = self.route(item)
+            batch = pending.get(processor)
+            if batch is None:
+                batch = pending[processor] = []
+            batch.append(item)
+            if len(batch) >= batch_size:
+                del pending[processor]
+                yield processor, batch
+        yield from pending.items()
+
+    def dispatch(
+        self, items: Iterable[Any], batch_size: int = 1024
+    ) -> Iterator[Tuple[DataProcessor, List[ProcessResult]]]:
+        """Process every routable item, one micro-batch at a time.
+
+        Items their processor's check() rejects are counted in rejected
+        and left out of the results instead of aborting the dispatch;
+        accepted items are processed without being validated again.
+        """
+        for processor, batch in self.batches(items, batch_size):
+            if processor is None:
+                self.unrouted += len(batch)
+                continue
+            results = []
+            for item in batch:
+                if processor.check(item).ok:
+                    results.append(processor._process(item))
+                else:
+                    self.rejected += 1
+            yield processor, results
 
 
 if __name__ == "__main__":
@@ -133,6 +909,10 @@ if __name__ == "__main__":
 
         print(f"Processing data: {d_view}")
 
+        verdict = proc.check(data)
+        if verdict.ok:
+            print(f"Validation: {verdict.message}")
+
         try:
             print(proc.process(data))
         except Exception as e:
@@ -148,10 +928,13 @@ if __name__ == "__main__":
     ]
 
     for i, (proc, data) in enumerate(demo_tasks, 1):
+        verdict = proc.check(data)
+        if verdict.ok:
+            print(f"Validation: {verdict.message}")
         try:
             raw_result = proc.process(data)
 
-            clean_res = raw_result.replace("Output: ", "")
+            clean_res = str(raw_result).replace("Output: ", "")
             print(f"Result {i}: {clean_res}")
         except Exception as e:
             print(f"Result {i}: Failed. Error: {e}")
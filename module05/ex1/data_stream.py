@@ -1,124 +1,1750 @@
 """Module for advanced polymorphic data streams in the Code Nexus."""
 
+import asyncio
+import heapq
+import math
+import os
+import pickle
+import re
+import struct
+import tempfile
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain, repeat
+from typing import (
+    Any, AsyncIterable, Callable, Deque, Iterable, Iterator, List, Dict,
+    NamedTuple, Sequence, Tuple, Type, Union, Optional
+)
+
+
+SENSOR_METRICS: tuple = ("temp", "humidity", "pressure")
+PARSE_CHUNK: int = 1 << 14
+JOIN_MIN_ITEMS: int = 64
+SHARD_LINES: int = 1 << 16
+_TEXT_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    m: re.compile(f"\n{m}:([^\n]*)") for m in SENSOR_METRICS
+}
+_BYTE_PATTERNS: Dict[str, "re.Pattern[bytes]"] = {
+    m: re.compile(f"\n{m}:([^\n]*)".encode()) for m in SENSOR_METRICS
+}
+_SEPARATORS: Dict[type, Any] = {str: ":", bytes: b":"}
+_METRIC_KEYS: Dict[Any, str] = {
+    key: m for m in SENSOR_METRICS for key in (m, m.encode())
+}
+LARGE_TRANSACTION: int = 500
+CHECKPOINT_MAGIC: bytes = b"NXCP"
+CHECKPOINT_VERSION: int = 2
+CHECKPOINT_TAIL: int = 4096
+_CHECKPOINT_HEADER = struct.Struct("<4sBIQ")
+
+Predicate = Callable[[str, float], bool]
+
+
+class Band(NamedTuple):
+    """Selects records whose value lies in [low, high].
+
+    metric restricts the band to one record key (a sensor metric, a
+    transaction side or an event name); None applies it to every key.
+    """
+
+    metric: Optional[str] = None
+    low: float = -math.inf
+    high: float = math.inf
+
+
+Criteria = Union[None, str, Band, Predicate]
+
+
+def _band_predicate(band: Band) -> Predicate:
+    """Compile a band into a (key, value) predicate."""
+    metric, low, high = band
+
+    def in_band(key: str, value: float) -> bool:
+        return low <= value <= high
+
+    def metric_in_band(key: str, value: float) -> bool:
+        return key == metric and low <= value <= high
+
+    return in_band if metric is None else metric_in_band
+
+
+def _sensor_critical(key: str, value: float) -> bool:
+    """Readings outside safe operating ranges."""
+    if key == "temp":
+        return value < 0.0 or value > 40.0
+    if key == "humidity":
+        return value > 90.0
+    return value < 950.0 or value > 1050.0
+
+
+def _event_critical(key: str, value: float) -> bool:
+    """Error events."""
+    return key == "error"
+
+
+class SensorColumns(NamedTuple):
+    """Typed columns of sensor readings, one array('d') per metric."""
+
+    columns: Dict[str, array]
+    errors: int
+    matches: List[Any]
+
+    @property
+    def readings(self) -> int:
+        """Number of readings converted across all metrics."""
+        return sum(len(values) for values in self.columns.values())
+
+
+def _parse_joined(chunk: List[Any], columns: Dict[str, array]) -> bool:
+    """Fast path for one homogeneous str or bytes chunk.
+
+    The chunk is joined once, each metric's values are pulled out by a
+    literal-prefix regex and converted by array('d', map(float, ...)),
+    so no per-item Python code runs. Returns False, leaving columns
+    untouched, when the chunk is mixed, holds embedded newlines or a
+    malformed value, so the caller can re-parse just this chunk item by
+    item.
+    """
+    if not chunk:
+        return True
+    patterns: Dict[str, Any]
+    if isinstance(chunk[0], str):
+        newline: Any = "\n"
+        patterns = _TEXT_PATTERNS
+    elif isinstance(chunk[0], bytes):
+        newline = b"\n"
+        patterns = _BYTE_PATTERNS
+    else:
+        return False
+    try:
+        text = newline + newline.join(chunk)
+        if text.count(newline) != len(chunk):
+            return False
+        parsed = [array("d", map(float, patterns[m].findall(text)))
+                  for m in columns]
+    except (TypeError, ValueError):
+        return False
+    for values, found in zip(columns.values(), parsed):
+        values.extend(found)
+    return True
+
+
+def _parse_items(
+    items: List[Any],
+    columns: Dict[str, array],
+    predicate: Optional[Predicate] = None
+) -> Tuple[int, List[Any]]:
+    """Per-item parser: append readings to columns.
+
+    Returns the number of malformed values and the matching items.
+    """
+    metric_keys = _METRIC_KEYS
+    separators = _SEPARATORS
+    errors = 0
+    matches: List[Any] = []
+    for item in items:
+        sep = separators.get(type(item))
+        if sep is None:
+            continue
+        key, _, raw = item.partition(sep)
+        metric = metric_keys.get(key)
+        if metric is None:
+            continue
+        try:
+            value = float(raw)
+        except ValueError:
+            errors += 1
+            continue
+        columns[metric].append(value)
+        if predicate is not None and predicate(metric, value):
+            matches.append(item)
+    return errors, matches
+
+
+def parse_sensor_batch(
+    data_batch: List[Any], predicate: Optional[Predicate] = None
+) -> SensorColumns:
+    """Classify and convert sensor readings in a single pass.
+
+    Accepts "metric:value" items as str or bytes; anything else is
+    ignored, and readings whose value is not a number count as errors.
+    Items for which predicate(metric, value) holds are collected as
+    matches during the same pass. Unfiltered batches of JOIN_MIN_ITEMS
+    or more take the joined fast path one PARSE_CHUNK at a time, and
+    only a chunk the fast path rejects is re-parsed item by item. Below
+    that size its setup costs more than the per-item loop, and filtered
+    batches stay on the loop so matches come out of the one pass, in
+    input order.
+    """
+    columns = {m: array("d") for m in SENSOR_METRICS}
+    if predicate is not None or len(data_batch) < JOIN_MIN_ITEMS:
+        errors, matches = _parse_items(data_batch, columns, predicate)
+        return SensorColumns(columns, errors, matches)
+    errors = 0
+    for start in range(0, len(data_batch), PARSE_CHUNK):
+        chunk = data_batch[start:start + PARSE_CHUNK]
+        if not _parse_joined(chunk, columns):
+            errors += _parse_items(chunk, columns)[0]
+    return SensorColumns(columns, errors, [])
+
+
+class RingBuffer:
+    """Fixed-capacity, array-backed window over a stream's recent values.
+
+    Values older than retention seconds (when set) are expired as well.
+    Count, sum, min and max are rolling aggregates, O(1) amortized per
+    update: each batch adds its math.fsum to a Neumaier-compensated
+    running sum and each eviction subtracts the fsum of the evicted
+    values. Once per capacity evictions the sum is recomputed from the
+    stored window, so rounding left by values long gone cannot pile up.
+    Monotonic deques of (sequence, value) pairs keep the extremes.
+    """
+
+    def __init__(
+        self, capacity: int = 1024, retention: Optional[float] = None
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity: int = capacity
+        self.retention: Optional[float] = retention
+        self._values: array = array("d", bytes(8 * capacity))
+        self._stamps: array = array("d", bytes(8 * capacity))
+        self._head: int = 0
+        self._size: int = 0
+        self._pushed: int = 0
+        self._sum: float = 0.0
+        self._error: float = 0.0
+        self._unsynced: int = 0
+        self._lows: Deque[Tuple[int, float]] = deque()
+        self._highs: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, value: float, now: Optional[float] = None) -> None:
+        """Append one value, evicting the oldest when full."""
+        self.extend((value,), now)
+
+    def extend(self, values: Iterable[float],
+               now: Optional[float] = None) -> None:
+        """Append a batch of values observed at the same instant."""
+        if now is None:
+            now = time.monotonic()
+        batch = values if isinstance(values, array) else list(values)
+        n = len(batch)
+        if n:
+            capacity = self.capacity
+            if n >= capacity:
+                self.clear()
+                self._pushed += n - capacity
+                batch = batch[n - capacity:]
+                n = capacity
+            column: array = (
+                batch if isinstance(batch, array) and batch.typecode == "d"
+                else array("d", batch)
+            )
+            overflow = self._size + n - capacity
+            if overflow > 0:
+                self._evict(overflow)
+            stamps = array("d", (now,)) * n
+            tail = (self._head + self._size) % capacity
+            end = tail + n
+            if end <= capacity:
+                self._values[tail:end] = column
+                self._stamps[tail:end] = stamps
+            else:
+                split = capacity - tail
+                self._values[tail:] = column[:split]
+                self._values[:end - capacity] = column[split:]
+                self._stamps[tail:] = stamps[:split]
+                self._stamps[:end - capacity] = stamps[split:]
+            self._size += n
+            self._add(math.fsum(column))
+            seq = self._pushed
+            lows, highs = self._lows, self._highs
+            for value in column:
+                while lows and lows[-1][1] >= value:
+                    lows.pop()
+                lows.append((seq, value))
+                while highs and highs[-1][1] <= value:
+                    highs.pop()
+                highs.append((seq, value))
+                seq += 1
+            self._pushed = seq
+        self._expire(now)
+
+    def clear(self) -> None:
+        """Forget every value in the window."""
+        self._head = 0
+        self._size = 0
+        self._sum = 0.0
+        self._error = 0.0
+        self._unsynced = 0
+        self._lows.clear()
+        self._highs.clear()
+
+    def _add(self, term: float) -> None:
+        """Neumaier step: add term, keeping the lost low-order bits."""
+        total = self._sum + term
+        if abs(self._sum) >= abs(term):
+            self._error += (self._sum - total) + term
+        else:
+            self._error += (term - total) + self._sum
+        self._sum = total
+
+    def _span(self, count: int) -> Iterator[float]:
+        """The count oldest stored values."""
+        head, capacity = self._head, self.capacity
+        end = head + count
+        if end <= capacity:
+            return iter(self._values[head:end])
+        return chain(self._values[head:], self._values[:end - capacity])
+
+    def _evict(self, count: int) -> None:
+        """Drop the count oldest values."""
+        if count >= self._size:
+            self.clear()
+            return
+        self._add(-math.fsum(self._span(count)))
+        self._head = (self._head + count) % self.capacity
+        self._size -= count
+        self._unsynced += count
+        if self._unsynced >= self.capacity:
+            self._sum = math.fsum(self._span(self._size))
+            self._error = 0.0
+            self._unsynced = 0
+        oldest = self._pushed - self._size
+        while self._lows[0][0] < oldest:
+            self._lows.popleft()
+        while self._highs[0][0] < oldest:
+            self._highs.popleft()
+
+    def _expire(self, now: float) -> None:
+        """Drop values that fell out of the retention period."""
+        if self.retention is None or not self._size:
+            return
+        horizon = now - self.retention
+        stamps, head, capacity = self._stamps, self._head, self.capacity
+        expired = bisect_left(range(self._size), horizon,
+                              key=lambda i: stamps[(head + i) % capacity])
+        if expired:
+            self._evict(expired)
+
+    def summary(
+        self, now: Optional[float] = None
+    ) -> Tuple[int, float, float, float]:
+        """Rolling count, sum, min and max, each read in O(1)."""
+        if now is None:
+            now = time.monotonic()
+        self._expire(now)
+        if not self._size:
+            return 0, 0.0, 0.0, 0.0
+        return (self._size, self._sum + self._error, self._lows[0][1],
+                self._highs[0][1])
+
+    def stats(
+        self, now: Optional[float] = None
+    ) -> Dict[str, Union[int, float]]:
+        """Rolling count, mean, min, max and rate (values per second)."""
+        if now is None:
+            now = time.monotonic()
+        count, total, low, high = self.summary(now)
+        if not count:
+            return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0,
+                    "rate": 0.0}
+        if self.retention is not None:
+            span = self.retention
+        else:
+            span = now - self._stamps[self._head]
+        return {
+            "count": count,
+            "mean": total / count,
+            "min": low,
+            "max": high,
+            "rate": count / span if span > 0 else 0.0,
+        }
+
+
+class WindowClock(str, Enum):
+    """What a window's size is measured in."""
+
+    COUNT = "count"
+    TIME = "time"
+
+
+class WindowResult(NamedTuple):
+    """Aggregate of one window.
+
+    start and end are record sequence numbers for count windows and
+    timestamps for time windows; the window covers [start, end).
+    """
+
+    start: float
+    end: float
+    records: int
+    total: float
+    low: float
+    high: float
+
+    @property
+    def mean(self) -> float:
+        """Average value in the window, 0.0 when it is empty."""
+        return self.total / self.records if self.records else 0.0
+
+
+Stamps = Union[None, float, Sequence[float]]
+
+
+class Window(ABC):
+    """Incremental window operator over a stream's values.
+
+    update() takes one batch with a single timestamp for the whole batch
+    or one per value (None means now on the monotonic clock) and returns
+    the windows it completed; the latest ones are also kept in closed.
+    Event times are expected in order: earlier stamps are treated as
+    arriving at the latest time seen.
+    """
+
+    def __init__(
+        self,
+        size: float,
+        clock: WindowClock = WindowClock.COUNT,
+        keep: int = 64
+    ) -> None:
+        if size <= 0:
+            raise ValueError("window size must be positive")
+        if clock is WindowClock.COUNT and size != int(size):
+            raise ValueError("count windows need a whole number size")
+        self.size: float = size
+        self.clock: WindowClock = clock
+        self.closed: Deque[WindowResult] = deque(maxlen=keep)
+        self._now: float = -math.inf
+
+    def _stamps(
+        self, values: Sequence[float], stamp: Stamps
+    ) -> Iterable[float]:
+        """One non-decreasing timestamp per value."""
+        if stamp is None:
+            stamp = time.monotonic()
+        if isinstance(stamp, (int, float)):
+            self._now = max(self._now, float(stamp))
+            return repeat(self._now, len(values))
+        clamped = array("d", stamp)
+        for i, t in enumerate(clamped):
+            if t < self._now:
+                clamped[i] = self._now
+            else:
+                self._now = t
+        return clamped
+
+    @abstractmethod
+    def update(
+        self, values: Sequence[float], stamp: Stamps = None
+    ) -> List[WindowResult]:
+        """Fold a batch of values in and return completed windows."""
+        pass
+
+    @abstractmethod
+    def current(self) -> WindowResult:
+        """Aggregate of the window in progress."""
+        pass
+
+
+class TumblingWindow(Window):
+    """Back-to-back windows of size records or size seconds.
+
+    Each value costs O(1): the open window keeps a running count, sum,
+    min and max and is emitted and reset when it fills (count) or when a
+    value falls into a later interval (time). Empty time windows are not
+    emitted.
+    """
+
+    def __init__(
+        self,
+        size: float,
+        clock: WindowClock = WindowClock.COUNT,
+        keep: int = 64
+    ) -> None:
+        super().__init__(size, clock, keep)
+        self._start: float = 0.0
+        self._count: int = 0
+        self._total: float = 0.0
+        self._low: float = math.inf
+        self._high: float = -math.inf
+
+    def _close(self) -> WindowResult:
+        """Emit the open window and start the next one."""
+        if self.clock is WindowClock.COUNT:
+            end = self._start + self._count
+        else:
+            end = self._start + self.size
+        result = WindowResult(self._start, end, self._count, self._total,
+                              self._low, self._high)
+        self.closed.append(result)
+        self._start = end
+        self._count = 0
+        self._total = 0.0
+        self._low = math.inf
+        self._high = -math.inf
+        return result
+
+    def update(
+        self, values: Sequence[float], stamp: Stamps = None
+    ) -> List[WindowResult]:
+        """Fold a batch in, closing every window it completes."""
+        done: List[WindowResult] = []
+        by_count = self.clock is WindowClock.COUNT
+        size = self.size
+        for value, t in zip(values, self._stamps(values, stamp)):
+            if not by_count and t >= self._start + size:
+                if self._count:
+                    done.append(self._close())
+                self._start = float(math.floor(t / size) * size)
+            self._count += 1
+            self._total += value
+            if value < self._low:
+                self._low = value
+            if value > self._high:
+                self._high = value
+            if by_count and self._count == size:
+                done.append(self._close())
+        return done
+
+    def current(self) -> WindowResult:
+        """Aggregate of the window still filling."""
+        if not self._count:
+            return WindowResult(self._start, self._start, 0, 0.0, 0.0, 0.0)
+        end = (self._start + self._count if self.clock is WindowClock.COUNT
+               else self._start + self.size)
+        return WindowResult(self._start, end, self._count, self._total,
+                            self._low, self._high)
+
+
+class SlidingWindow(Window):
+    """The last size records, or the last size seconds, of values.
+
+    The values sit in a RingBuffer whose rolling aggregates are kept
+    incrementally: a compensated running sum that evictions subtract
+    from, and monotonic deques for the extremes. Each slide is
+    therefore O(1) amortized, and reading the window never rescans it.
+    Time windows hold at most capacity values. Every update emits the
+    window as it stands afterwards.
+    """
+
+    def __init__(
+        self,
+        size: float,
+        clock: WindowClock = WindowClock.COUNT,
+        keep: int = 64,
+        capacity: int = 1 << 16
+    ) -> None:
+        super().__init__(size, clock, keep)
+        if clock is WindowClock.COUNT:
+            self._buffer = RingBuffer(int(size))
+        else:
+            self._buffer = RingBuffer(capacity, retention=size)
+        self._seen: int = 0
+
+    def update(
+        self, values: Sequence[float], stamp: Stamps = None
+    ) -> List[WindowResult]:
+        """Slide the window over a batch and emit it."""
+        if not len(values):
+            return []
+        stamps = self._stamps(values, stamp)
+        if isinstance(stamps, repeat):
+            self._buffer.extend(values, self._now)
+        else:
+            for value, t in zip(values, stamps):
+                self._buffer.push(value, t)
+        self._seen += len(values)
+        result = self.current()
+        self.closed.append(result)
+        return [result]
+
+    def current(self) -> WindowResult:
+        """Aggregate of the values currently inside the window."""
+        count, total, low, high = self._buffer.summary(self._now)
+        if self.clock is WindowClock.COUNT:
+            start, end = float(self._seen - count), float(self._seen)
+        else:
+            start, end = self._now - self.size, self._now
+        return WindowResult(start, end, count, total, low, high)
+
+
+class StreamAggregate(ABC):
+    """Mergeable totals of one stream; merging partials is exact."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def records(self) -> int:
+        """Records that were parsed into these totals."""
+        pass
+
+    @property
+    def rejected(self) -> int:
+        """Records that were dropped as unparsable."""
+        return 0
+
+    @abstractmethod
+    def merge(self, other: Any) -> None:
+        """Fold totals of the same kind into this one."""
+        pass
+
+
+class SensorAggregate(StreamAggregate):
+    """Per-metric reading counts and sums."""
+
+    __slots__ = ("counts", "sums", "errors")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {m: 0 for m in SENSOR_METRICS}
+        self.sums: Dict[str, float] = {m: 0.0 for m in SENSOR_METRICS}
+        self.errors: int = 0
+
+    @property
+    def readings(self) -> int:
+        """Readings across all metrics."""
+        return sum(self.counts.values())
+
+    @property
+    def records(self) -> int:
+        """Readings across all metrics."""
+        return self.readings
+
+    @property
+    def rejected(self) -> int:
+        """Malformed readings."""
+        return self.errors
+
+    def mean(self, metric: str) -> float:
+        """Average value of one metric, 0.0 when none was seen."""
+        count = self.counts[metric]
+        return self.sums[metric] / count if count else 0.0
+
+    def add(self, parsed: SensorColumns) -> None:
+        """Account for one parsed batch."""
+        for metric, values in parsed.columns.items():
+            self.counts[metric] += len(values)
+            self.sums[metric] += math.fsum(values)
+        self.errors += parsed.errors
+
+    def merge(self, other: "SensorAggregate") -> None:
+        """Add another sensor aggregate's counts and sums."""
+        for metric in SENSOR_METRICS:
+            self.counts[metric] += other.counts[metric]
+            self.sums[metric] += other.sums[metric]
+        self.errors += other.errors
+
+
+class FlowTable:
+    """Per-key net flow and operation counts in compact arrays.
+
+    A single dict maps each key ("ACCT" or "ACCT:INSTR") to a row; the
+    figures live in parallel array('q') columns instead of one Python
+    object per key, so millions of keys stay cheap to hold and merge.
+    A row whose net flow outgrows int64 moves to a Python int in _wide
+    (its array slot stays 0), so large accounts never overflow.
+    """
+
+    __slots__ = ("keys", "net", "ops", "_rows", "_wide")
+
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+        self.net: array = array("q")
+        self.ops: array = array("q")
+        self._rows: Dict[str, int] = {}
+        self._wide: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def add(self, key: str, amount: int, ops: int = 1) -> None:
+        """Add a signed amount to a key, creating its row on first use."""
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self.keys)
+            self.keys.append(key)
+            self.net.append(0)
+            self.ops.append(0)
+        if row in self._wide:
+            self._wide[row] += amount
+        else:
+            try:
+                self.net[row] += amount
+            except OverflowError:
+                self._wide[row] = self.net[row] + amount
+                self.net[row] = 0
+        self.ops[row] += ops
+
+    def _net(self, row: int) -> int:
+        """Net flow of a row, wherever it is stored."""
+        wide = self._wide.get(row)
+        return self.net[row] if wide is None else wide
+
+    def get(self, key: str) -> int:
+        """Net flow of a key, 0 when it was never seen."""
+        row = self._rows.get(key)
+        return 0 if row is None else self._net(row)
+
+    def merge(self, other: "FlowTable") -> None:
+        """Add every row of another table."""
+        for row, key in enumerate(other.keys):
+            self.add(key, other._net(row), other.ops[row])
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """The k keys with the largest absolute net flow."""
+        net = self.net if not self._wide else list(
+            map(self._net, range(len(self.keys))))
+        rows = heapq.nlargest(k, range(len(net)), key=lambda r: abs(net[r]))
+        return [(self.keys[r], net[r]) for r in rows]
+
+    def rollup(self) -> "FlowTable":
+        """Collapse "ACCT:INSTR" keys into per-account totals."""
+        accounts = FlowTable()
+        for row, key in enumerate(self.keys):
+            accounts.add(key.partition(":")[0], self._net(row),
+                         self.ops[row])
+        return accounts
+
+
+class TransactionAggregate(StreamAggregate):
+    """Operation count, integer net flow and per-account flows."""
+
+    __slots__ = ("ops", "net", "accounts", "errors")
+
+    def __init__(self) -> None:
+        self.ops: int = 0
+        self.net: int = 0
+        self.accounts: FlowTable = FlowTable()
+        self.errors: int = 0
+
+    @property
+    def records(self) -> int:
+        """Buy and sell operations."""
+        return self.ops
+
+    @property
+    def rejected(self) -> int:
+        """Operations whose amount is not an integer."""
+        return self.errors
+
+    def top_accounts(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Accounts (or account:instrument keys) with the largest flows."""
+        return self.accounts.top(k)
+
+    def merge(self, other: "TransactionAggregate") -> None:
+        """Add another transaction aggregate."""
+        self.ops += other.ops
+        self.net += other.net
+        self.accounts.merge(other.accounts)
+        self.errors += other.errors
+
+
+class SketchConfig(NamedTuple):
+    """Fixed memory budget of the event sketches.
+
+    The count-min table holds width * depth 8-byte counters, Space-Saving
+    keeps top_n names and HyperLogLog 2 ** precision one-byte registers.
+    """
+
+    width: int = 2048
+    depth: int = 4
+    top_n: int = 64
+    precision: int = 12
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash_pair(name: str) -> Tuple[int, int]:
+    """Two independent 64-bit hashes of a name, stable across processes."""
+    digest = blake2b(name.encode(), digest_size=16).digest()
+    return (int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little"))
+
+
+class CountMinSketch:
+    """Approximate per-name counts that never under-estimate."""
+
+    __slots__ = ("width", "depth", "table")
+
+    def __init__(self, width: int = 2048, depth: int = 4) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width: int = width
+        self.depth: int = depth
+        self.table: array = array("q", bytes(8 * width * depth))
+
+    def _cells(self, name: str) -> Iterator[int]:
+        """Counter index of name in every row (double hashing)."""
+        h1, h2 = _hash_pair(name)
+        width = self.width
+        for row in range(self.depth):
+            yield row * width + (h1 + row * h2) % width
+
+    def add(self, name: str, count: int = 1) -> None:
+        """Count name count more times."""
+        table = self.table
+        for cell in self._cells(name):
+            table[cell] += count
+
+    def estimate(self, name: str) -> int:
+        """Upper-bound estimate of how often name was counted."""
+        table = self.table
+        return min(table[cell] for cell in self._cells(name))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Add another sketch of the same shape."""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge count-min sketches of "
+                             "different shapes")
+        self.table = array("q", map(int.__add__, self.table, other.table))
+
+
+class SpaceSaving:
+    """Top-N heavy hitters with bounded over-estimation.
+
+    Counts of tracked names are upper bounds and errors bound how much
+    each may be over; merging follows the mergeable-summaries rule where
+    a name missing from a full summary is assumed at its minimum count.
+    """
+
+    __slots__ = ("capacity", "counts", "errors")
+
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity: int = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def floor(self) -> int:
+        """Largest count an untracked name may have."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def update(self, counts: Dict[str, int]) -> None:
+        """Add exact counts, such as those of one batch."""
+        self._combine(counts, {}, 0)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Add another summary."""
+        self._combine(other.counts, other.errors, other.floor())
+
+    def _combine(
+        self, counts: Dict[str, int], errors: Dict[str, int], floor: int
+    ) -> None:
+        """Sum two summaries and keep the capacity largest names."""
+        own_counts, own_errors = self.counts, self.errors
+        own_floor = self.floor()
+        names = own_counts.keys() | counts.keys()
+        merged = {n: own_counts.get(n, own_floor) + counts.get(n, floor)
+                  for n in names}
+        keep = heapq.nlargest(self.capacity, merged, key=merged.__getitem__)
+        self.counts = {n: merged[n] for n in keep}
+        self.errors = {n: own_errors.get(n, own_floor) + errors.get(n, floor)
+                       for n in keep}
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """The n names with the highest estimated counts."""
+        counts = self.counts
+        return [(name, counts[name])
+                for name in heapq.nlargest(n, counts, key=counts.__getitem__)]
+
+
+class HyperLogLog:
+    """Approximate number of distinct names in 2 ** precision bytes."""
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision: int = precision
+        self.registers: bytearray = bytearray(1 << precision)
+
+    def add(self, name: str) -> None:
+        """Observe a name."""
+        bits = 64 - self.precision
+        h = _hash_pair(name)[0]
+        index = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        """Estimated number of distinct names observed."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            raw = m * math.log(m / zeros)
+        return int(round(raw))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Union with another sketch of the same precision."""
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLogs of "
+                             "different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class EventCounts(StreamAggregate):
+    """Exact per-name counts of one batch, before any sketching."""
+
+    __slots__ = ("events", "errors", "names")
+
+    def __init__(self, names: Dict[str, int]) -> None:
+        self.names: Dict[str, int] = names
+        self.events: int = sum(names.values())
+        self.errors: int = names.get("error", 0)
+
+    @property
+    def records(self) -> int:
+        """Events of any name."""
+        return self.events
+
+    def merge(self, other: "EventCounts") -> None:
+        """Add another batch's counts."""
+        if not isinstance(self.names, Counter):
+            self.names = Counter(self.names)
+        self.names.update(other.names)
+        self.events += other.events
+        self.errors += other.errors
+
+
+class EventAggregate(StreamAggregate):
+    """Event and error counts plus fixed-size sketches of event names.
+
+    Count-min and HyperLogLog merges equal the sketch of the combined
+    input; Space-Saving merges keep its over-estimation bound. Merging
+    EventCounts folds them into the sketches in place, at a cost that
+    follows the batch's distinct names rather than the sketch size.
+    """
+
+    __slots__ = ("events", "errors", "frequencies", "heavy", "distinct")
+
+    def __init__(self, sketch: SketchConfig = SketchConfig()) -> None:
+        self.events: int = 0
+        self.errors: int = 0
+        self.frequencies = CountMinSketch(sketch.width, sketch.depth)
+        self.heavy = SpaceSaving(sketch.top_n)
+        self.distinct = HyperLogLog(sketch.precision)
+
+    @property
+    def records(self) -> int:
+        """Events of any name."""
+        return self.events
+
+    def add(self, counts: Dict[str, int]) -> None:
+        """Fold exact per-name counts of a batch into the sketches."""
+        frequencies, distinct = self.frequencies, self.distinct
+        for name, count in counts.items():
+            frequencies.add(name, count)
+            distinct.add(name)
+        self.heavy.update(counts)
+        self.events += sum(counts.values())
+        self.errors += counts.get("error", 0)
+
+    def count(self, name: str) -> int:
+        """Approximate number of occurrences of an event name."""
+        return self.frequencies.estimate(name)
+
+    def top(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Approximate n most frequent event names."""
+        return self.heavy.top(n)
+
+    def cardinality(self) -> int:
+        """Approximate number of distinct event names."""
+        return self.distinct.estimate()
+
+    def merge(self, other: Union["EventAggregate", EventCounts]) -> None:
+        """Add another event aggregate or a batch's exact counts."""
+        if isinstance(other, EventCounts):
+            self.add(other.names)
+            return
+        self.events += other.events
+        self.errors += other.errors
+        self.frequencies.merge(other.frequencies)
+        self.heavy.merge(other.heavy)
+        self.distinct.merge(other.distinct)
+
+
+class BatchReport(ABC):
+    """Typed outcome of one processed batch.
+
+    Carries the batch aggregate so callers read counts directly, and the
+    records that matched the batch's criteria, if any were given; str()
+    renders the stream's human-readable report.
+    """
+
+    __slots__ = ("stream_id", "aggregate", "matches")
+
+    label: str = "Stream data"
+    unit: str = "records"
+
+    def __init__(
+        self,
+        stream_id: str,
+        aggregate: StreamAggregate,
+        matches: Optional[List[Any]] = None
+    ) -> None:
+        self.stream_id: str = stream_id
+        self.aggregate: StreamAggregate = aggregate
+        self.matches: List[Any] = matches if matches is not None else []
+
+    @property
+    def count(self) -> int:
+        """Records the batch contributed."""
+        return self.aggregate.records
+
+    @property
+    def matched(self) -> int:
+        """Records that matched the batch's criteria."""
+        return len(self.matches)
+
+    @abstractmethod
+    def __str__(self) -> str:
+        """Human-readable report line."""
+        pass
+
+
+class SensorReport(BatchReport):
+    """Report of one sensor batch."""
+
+    __slots__ = ()
+
+    label = "Sensor data"
+    unit = "readings"
+    aggregate: SensorAggregate
+
+    def __str__(self) -> str:
+        return (f"Sensor analysis: {self.aggregate.readings} readings "
+                f"processed, avg temp: {self.aggregate.mean('temp'):.1f}°C")
+
+
+class TransactionReport(BatchReport):
+    """Report of one transaction batch."""
+
+    __slots__ = ()
+
+    label = "Transaction data"
+    unit = "operations"
+    aggregate: TransactionAggregate
+
+    def __str__(self) -> str:
+        return (f"Transaction analysis: {self.aggregate.ops} operations, "
+                f"net flow: {self.aggregate.net:+d} units")
+
+
+class EventReport(BatchReport):
+    """Report of one event batch."""
+
+    __slots__ = ()
+
+    label = "Event data"
+    unit = "events"
+    aggregate: EventCounts
+
+    def __str__(self) -> str:
+        return (f"Event analysis: {self.aggregate.events} events, "
+                f"{self.aggregate.errors} error detected")
+
+
+def render_reports(reports: Iterable[BatchReport]) -> str:
+    """Format per-stream batch reports as the processor summary."""
+    return "\n".join(f" - {r.label}: {r.count} {r.unit} processed"
+                     for r in reports)
+
+
+class LatencyHistogram:
+    """HDR-style histogram of nanosecond durations.
+
+    Values below 16 get exact buckets; above that every power of two is
+    split into 8 linear sub-buckets, so any recorded value is known to
+    within 12.5% in a fixed table of 512 counters.
+    """
+
+    __slots__ = ("buckets", "count", "total")
+
+    SUB_BITS: int = 3
+    SIZE: int = 512
+
+    def __init__(self) -> None:
+        self.buckets: array = array("q", bytes(8 * self.SIZE))
+        self.count: int = 0
+        self.total: int = 0
+
+    @staticmethod
+    def index(value: int) -> int:
+        """Bucket holding a non-negative value."""
+        shift = value.bit_length() - LatencyHistogram.SUB_BITS - 1
+        if shift <= 0:
+            return value
+        return (shift << LatencyHistogram.SUB_BITS) + (value >> shift)
+
+    @staticmethod
+    def bounds(index: int) -> Tuple[int, int]:
+        """Smallest and largest value that fall into a bucket."""
+        bits = LatencyHistogram.SUB_BITS
+        sub = 1 << bits
+        if index < 2 * sub:
+            return index, index
+        shift = (index >> bits) - 1
+        low = (sub + (index & (sub - 1))) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Add one duration in nanoseconds."""
+        self.buckets[self.index(max(0, value))] += 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q: float) -> int:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank:
+                return self.bounds(index)[1]
+        return self.bounds(self.SIZE - 1)[1]
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram."""
+        self.buckets = array("q", map(int.__add__, self.buckets,
+                                      other.buckets))
+        self.count += other.count
+        self.total += other.total
+
+
+class StreamMetrics:
+    """Counters one stream updates once per batch."""
+
+    __slots__ = ("records_in", "records_out", "parse_errors", "batches",
+                 "queue_depth", "latency")
+
+    def __init__(self) -> None:
+        self.records_in: int = 0
+        self.records_out: int = 0
+        self.parse_errors: int = 0
+        self.batches: int = 0
+        self.queue_depth: int = 0
+        self.latency: LatencyHistogram = LatencyHistogram()
+
+    def observe(
+        self, aggregate: StreamAggregate, offered: int, elapsed_ns: int
+    ) -> None:
+        """Account for one processed batch."""
+        self.records_in += offered
+        self.records_out += aggregate.records
+        self.parse_errors += aggregate.rejected
+        self.batches += 1
+        self.latency.record(elapsed_ns)
+
+
+_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+_COUNTERS: Tuple[Tuple[str, str, str], ...] = (
+    ("records_in", "counter", "Records offered to the stream."),
+    ("records_out", "counter", "Records parsed by the stream."),
+    ("parse_errors", "counter", "Records rejected as unparsable."),
+    ("batches", "counter", "Batches processed."),
+    ("queue_depth", "gauge", "Items waiting in the ingestion queue."),
+)
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return (value.replace("\\", "\\\\").replace('"', '\\"')
+            .replace("\n", "\\n"))
+
+
+class MetricsRegistry:
+    """Per-stream metrics, exportable as a Prometheus text snapshot."""
+
+    def __init__(self, prefix: str = "nexus") -> None:
+        self.prefix: str = prefix
+        self.streams: Dict[str, StreamMetrics] = {}
+
+    def register(self, stream: "DataStream") -> None:
+        """Expose a stream's metrics under its id."""
+        self.streams[stream.stream_id] = stream.metrics
+
+    def to_prometheus(self) -> str:
+        """Render every registered stream in the text exposition format."""
+        lines: List[str] = []
+        labels = {sid: f'stream="{_label(sid)}"' for sid in self.streams}
+        for field, kind, help_text in _COUNTERS:
+            name = f"{self.prefix}_{field}"
+            if kind == "counter":
+                name += "_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sid, metrics in self.streams.items():
+                lines.append(f"{name}{{{labels[sid]}}} "
+                             f"{getattr(metrics, field)}")
+        name = f"{self.prefix}_batch_latency_seconds"
+        lines.append(f"# HELP {name} Time to process one batch.")
+        lines.append(f"# TYPE {name} summary")
+        for sid, metrics in self.streams.items():
+            latency = metrics.latency
+            for q in _QUANTILES:
+                lines.append(f'{name}{{{labels[sid]},quantile="{q}"}} '
+                             f"{latency.percentile(q) / 1e9:.9f}")
+            lines.append(f"{name}_sum{{{labels[sid]}}} "
+                         f"{latency.total / 1e9:.9f}")
+            lines.append(f"{name}_count{{{labels[sid]}}} {latency.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically replace path with a fresh text snapshot.
+
+        Suitable for the node_exporter textfile collector, which must
+        never observe a half-written file.
+        """
+        _write_atomic(path, self.to_prometheus().encode())
+
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    """Replace path with payload so readers see the old or new file only.
+
+    The data is fsynced before the rename and the directory after it, so
+    a crash at any point leaves one complete version on disk.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 class DataStream(ABC):
     """Abstract base class for all specialized data streams."""
 
-    def __init__(self, stream_id: str) -> None:
+    route_keys: Tuple[str, ...] = ()
+    route_bare: bool = False
+    presets: Dict[str, Criteria] = {}
+    aggregate_type: Type[StreamAggregate]
+
+    def __init__(
+        self,
+        stream_id: str,
+        history_size: int = 1024,
+        retention: Optional[float] = None
+    ) -> None:
         self.stream_id: str = stream_id
-        self.data_history: List[Any] = []
+        self.data_history: RingBuffer = RingBuffer(history_size, retention)
+        self._predicates: Dict[Any, Optional[Predicate]] = {}
+        self.totals: StreamAggregate = self.new_aggregate()
+        self.metrics: StreamMetrics = StreamMetrics()
+        self.windows: Dict[str, Window] = {}
+
+    @abstractmethod
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        event_time: Stamps = None,
+        criteria: Criteria = None
+    ) -> BatchReport:
+        """Process a batch of data observed at event_time (default now).
+
+        Records matching criteria are collected on the report during the
+        same parsing pass.
+        """
+        pass
 
     @abstractmethod
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process a batch of data."""
+    def _aggregate(
+        self, data_batch: List[Any], predicate: Optional[Predicate] = None
+    ) -> Tuple[Any, array, List[Any]]:
+        """Parse a batch into its aggregate, history values and matches."""
         pass
 
+    def new_aggregate(self) -> Any:
+        """Empty aggregate matching this stream's configuration."""
+        return self.aggregate_type()
+
+    def shard_options(self) -> Dict[str, Any]:
+        """Constructor options a worker needs to rebuild this stream."""
+        return {}
+
+    def summarize(self, data_batch: List[Any]) -> Any:
+        """Aggregate a batch without touching this stream's state."""
+        return self._aggregate(data_batch)[0]
+
+    def add_window(self, name: str, window: Window) -> Window:
+        """Attach a window operator fed with every batch's values.
+
+        Windows see the same values as the history: sensor temperatures,
+        signed transaction amounts or event error flags (1.0 per error).
+        """
+        self.windows[name] = window
+        return window
+
+    def _ingest(
+        self,
+        data_batch: List[Any],
+        event_time: Stamps = None,
+        predicate: Optional[Predicate] = None
+    ) -> Tuple[Any, List[Any]]:
+        """Aggregate a batch and fold it into history, totals and windows.
+
+        Returns the batch aggregate and the records matching predicate.
+        """
+        started = time.perf_counter_ns()
+        aggregate, values, matches = self._aggregate(data_batch, predicate)
+        self.data_history.extend(values)
+        self.totals.merge(aggregate)
+        for window in self.windows.values():
+            window.update(values, event_time)
+        self.metrics.observe(aggregate, len(data_batch),
+                             time.perf_counter_ns() - started)
+        return aggregate, matches
+
     @abstractmethod
     def filter_data(
         self,
         data_batch: List[Any],
-        criteria: Optional[str] = None
+        criteria: Criteria = None
     ) -> List[Any]:
         """Abstract filter to be implemented by each stream type."""
         pass
 
+    def knows(self, criteria: Criteria) -> bool:
+        """False when criteria names a preset this stream does not have."""
+        return not isinstance(criteria, str) or criteria in self.presets
+
+    def compile_criteria(self, criteria: Criteria) -> Optional[Predicate]:
+        """Turn criteria into a (key, value) predicate, once per criteria.
+
+        Accepts a preset name from the stream's presets, a Band, a
+        predicate callable, or None for no filtering.
+        """
+        if criteria is None or callable(criteria):
+            return criteria
+        if criteria in self._predicates:
+            return self._predicates[criteria]
+        spec: Criteria = criteria
+        if isinstance(spec, str):
+            if spec not in self.presets:
+                raise ValueError(f"Unknown criteria for "
+                                 f"{type(self).__name__}: {spec!r}")
+            spec = self.presets[spec]
+        predicate: Optional[Predicate]
+        if spec is None:
+            predicate = None
+        elif isinstance(spec, Band):
+            predicate = _band_predicate(spec)
+        elif callable(spec):
+            predicate = spec
+        else:
+            raise ValueError(f"Unsupported criteria: {spec!r}")
+        self._predicates[criteria] = predicate
+        return predicate
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        """Return basic stream statistics."""
-        return {"id": self.stream_id}
+        """Return stream id, rolling aggregates and lifetime metrics."""
+        stats: Dict[str, Union[str, int, float]] = {"id": self.stream_id}
+        stats.update(self.data_history.stats())
+        metrics = self.metrics
+        stats.update({
+            "records_in": metrics.records_in,
+            "records_out": metrics.records_out,
+            "parse_errors": metrics.parse_errors,
+            "p50_ms": metrics.latency.percentile(0.5) / 1e6,
+            "p99_ms": metrics.latency.percentile(0.99) / 1e6,
+        })
+        return stats
 
 
 class SensorStream(DataStream):
     """Specialized stream for environmental data."""
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process temp strings and return average."""
-        readings = 0
-        total_temp = 0.0
-        ntemps = 0
-        for item in data_batch:
-            if isinstance(item, str):
-                if item.startswith("temp:"):
-                    total_temp += float(item.split(":")[1])
-                    ntemps += 1
-                    readings += 1
-                elif (item.startswith("humidity:") or
-                      item.startswith("pressure:")):
-                    readings += 1
-
-        if ntemps > 0:
-            avg = total_temp / ntemps
-        else:
-            avg = 0.0
-        res = (f"Sensor analysis: {readings} readings processed, "
-               f"avg temp: {avg:.1f}°C")
-        return res
+    route_keys: Tuple[str, ...] = SENSOR_METRICS
+    presets: Dict[str, Criteria] = {"critical": _sensor_critical}
+    aggregate_type = SensorAggregate
+
+    def _aggregate(
+        self, data_batch: List[Any], predicate: Optional[Predicate] = None
+    ) -> Tuple[SensorAggregate, array, List[Any]]:
+        """Parse readings into typed columns and total them."""
+        parsed = parse_sensor_batch(data_batch, predicate)
+        aggregate = SensorAggregate()
+        aggregate.add(parsed)
+        return aggregate, parsed.columns["temp"], parsed.matches
+
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        event_time: Stamps = None,
+        criteria: Criteria = None
+    ) -> SensorReport:
+        """Parse readings into typed columns and report average temp."""
+        aggregate, matches = self._ingest(
+            data_batch, event_time, self.compile_criteria(criteria))
+        return SensorReport(self.stream_id, aggregate, matches)
 
     def filter_data(
         self,
         data_batch: List[Any],
-        criteria: Optional[str] = None
+        criteria: Criteria = None
     ) -> List[Any]:
-        """Filter critical sensor alerts."""
-        if criteria == "critical":
-            return ["2 critical sensor alerts"]
-        return []
+        """Return readings matching criteria, parsed in the same pass."""
+        predicate = self.compile_criteria(criteria)
+        if predicate is None:
+            return []
+        return parse_sensor_batch(data_batch, predicate).matches
 
 
 class TransactionStream(DataStream):
     """Specialized stream for financial data."""
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process buy/sell strings and return net flow."""
-        ops = 0
+    route_keys: Tuple[str, ...] = ("buy", "sell")
+    presets: Dict[str, Criteria] = {
+        "critical": Band(None, LARGE_TRANSACTION),
+        "large": Band(None, LARGE_TRANSACTION),
+    }
+    aggregate_type = TransactionAggregate
+
+    def _scan(
+        self,
+        data_batch: List[Any],
+        predicate: Optional[Predicate],
+        accounts: Optional[FlowTable] = None
+    ) -> Tuple[array, int, List[Any], int]:
+        """Parse signed flows and collect matches in one pass.
+
+        Records are "side:N", "side:ACCT:N" or "side:ACCT:INSTR:N", as
+        str or UTF-8 bytes, the same keys the router sends here; keyed
+        records are added to accounts when a table is given. Returns the
+        flows as floats for history and windows, their exact net as a
+        Python int (amounts are not limited to int64), the matches and
+        the number of operations skipped because their amount is not an
+        integer or does not even fit a float.
+        """
+        flows = array("d")
         net = 0
+        matches: List[Any] = []
+        errors = 0
+        add = accounts.add if accounts is not None else None
         for item in data_batch:
-            if isinstance(item, str):
-                if item.startswith("buy:"):
-                    net += int(item.split(":")[1])
-                    ops += 1
-                elif item.startswith("sell:"):
-                    net -= int(item.split(":")[1])
-                    ops += 1
-
-        res = (f"Transaction analysis: {ops} operations, "
-               f"net flow: {net:+d} units")
-        return res
+            if isinstance(item, bytes):
+                text = item.decode("utf-8", "replace")
+            elif isinstance(item, str):
+                text = item
+            else:
+                continue
+            side, _, rest = text.partition(":")
+            if side == "buy":
+                sign = 1
+            elif side == "sell":
+                sign = -1
+            else:
+                continue
+            key, _, raw = rest.rpartition(":")
+            try:
+                amount = int(raw)
+                flows.append(sign * amount)
+            except (ValueError, OverflowError):
+                errors += 1
+                continue
+            net += sign * amount
+            if key and add is not None:
+                add(key, sign * amount)
+            if predicate is not None and predicate(side, amount):
+                matches.append(item)
+        return flows, net, matches, errors
+
+    def _aggregate(
+        self, data_batch: List[Any], predicate: Optional[Predicate] = None
+    ) -> Tuple[TransactionAggregate, array, List[Any]]:
+        """Total the signed flows of a batch, overall and per account."""
+        aggregate = TransactionAggregate()
+        flows, aggregate.net, matches, aggregate.errors = self._scan(
+            data_batch, predicate, aggregate.accounts)
+        aggregate.ops = len(flows)
+        return aggregate, flows, matches
+
+    def top_accounts(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Lifetime top-k accounts by absolute net flow."""
+        return self.totals.top_accounts(k)  # type: ignore[attr-defined]
+
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        event_time: Stamps = None,
+        criteria: Criteria = None
+    ) -> TransactionReport:
+        """Process buy/sell strings and report net flow."""
+        aggregate, matches = self._ingest(
+            data_batch, event_time, self.compile_criteria(criteria))
+        return TransactionReport(self.stream_id, aggregate, matches)
 
     def filter_data(
         self,
         data_batch: List[Any],
-        criteria: Optional[str] = None
+        criteria: Criteria = None
     ) -> List[Any]:
-        """Filter large transactions."""
-        if criteria == "critical":
-            return ["1 large transaction"]
-        return []
+        """Return operations matching criteria; amounts are unsigned."""
+        predicate = self.compile_criteria(criteria)
+        if predicate is None:
+            return []
+        return self._scan(data_batch, predicate)[2]
 
 
 class EventStream(DataStream):
-    """Specialized stream for system events."""
+    """Specialized stream for system events.
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process event strings and count errors."""
-        events = 0
-        errors = 0
+    Any bare word (a record without ":") is an event name. Names are
+    counted exactly per batch, then folded into fixed-size sketches, so
+    memory does not grow with the event vocabulary.
+    """
+
+    route_bare: bool = True
+    presets: Dict[str, Criteria] = {"critical": _event_critical}
+    aggregate_type = EventAggregate
+
+    def __init__(
+        self,
+        stream_id: str,
+        history_size: int = 1024,
+        retention: Optional[float] = None,
+        sketch: SketchConfig = SketchConfig()
+    ) -> None:
+        self.sketch: SketchConfig = sketch
+        super().__init__(stream_id, history_size, retention)
+
+    def new_aggregate(self) -> EventAggregate:
+        """Empty aggregate with this stream's sketch sizes."""
+        return EventAggregate(self.sketch)
+
+    def shard_options(self) -> Dict[str, Any]:
+        """Workers must build sketches of the same shape to merge them."""
+        return {"sketch": self.sketch}
+
+    def _scan(
+        self, data_batch: List[Any], predicate: Optional[Predicate]
+    ) -> Tuple[List[str], List[Any]]:
+        """Extract event names and collect matches in one pass."""
+        names: List[str] = []
+        matches: List[Any] = []
         for item in data_batch:
-            if item in ["login", "logout", "error"]:
-                events += 1
-                if item == "error":
-                    errors += 1
-        return f"Event analysis: {events} events, {errors} error detected"
+            if isinstance(item, bytes) and b":" not in item:
+                name = item.decode("utf-8", "replace")
+            elif isinstance(item, str) and ":" not in item:
+                name = item
+            else:
+                continue
+            names.append(name)
+            if predicate is not None and predicate(name, 1.0):
+                matches.append(item)
+        return names, matches
+
+    def _aggregate(
+        self, data_batch: List[Any], predicate: Optional[Predicate] = None
+    ) -> Tuple[EventCounts, array, List[Any]]:
+        """Count event names of a batch exactly.
+
+        The counts are folded into the totals' sketches by merge, so a
+        batch never allocates sketches of its own.
+        """
+        names, matches = self._scan(data_batch, predicate)
+        flags = array("d", [name == "error" for name in names])
+        return EventCounts(Counter(names)), flags, matches
+
+    def summarize(self, data_batch: List[Any]) -> EventAggregate:
+        """Sketch a batch on its own, bounding what a shard sends back."""
+        aggregate = self.new_aggregate()
+        aggregate.merge(self._aggregate(data_batch)[0])
+        return aggregate
+
+    def top_events(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Lifetime heavy hitters by approximate count."""
+        return self.totals.top(n)  # type: ignore[attr-defined]
+
+    def distinct_events(self) -> int:
+        """Lifetime approximate number of distinct event names."""
+        return self.totals.cardinality()  # type: ignore[attr-defined]
+
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        event_time: Stamps = None,
+        criteria: Criteria = None
+    ) -> EventReport:
+        """Process event strings and count errors."""
+        aggregate, matches = self._ingest(
+            data_batch, event_time, self.compile_criteria(criteria))
+        return EventReport(self.stream_id, aggregate, matches)
 
     def filter_data(
         self,
         data_batch: List[Any],
-        criteria: Optional[str] = None
+        criteria: Criteria = None
     ) -> List[Any]:
-        """Filter event data (none critical)."""
-        return []
+        """Return events matching criteria (each event has value 1)."""
+        predicate = self.compile_criteria(criteria)
+        if predicate is None:
+            return []
+        return self._scan(data_batch, predicate)[1]
+
+
+class StreamRouter:
+    """Classifies each item once into per-stream sub-batches.
+
+    Items are keyed by their prefix before ":" (or the whole item when
+    there is none) and looked up in a table built from each stream's
+    route_keys, so the cost per item does not grow with the number of
+    registered streams. Bare words matching no key go to the streams
+    that set route_bare.
+    """
+
+    def __init__(self) -> None:
+        self.streams: List[DataStream] = []
+        self._table: Dict[Any, List[DataStream]] = {}
+        self._bare: List[DataStream] = []
+
+    def add(self, stream: DataStream) -> None:
+        """Register the keys a stream consumes."""
+        self.streams.append(stream)
+        for key in stream.route_keys:
+            self._table.setdefault(key, []).append(stream)
+            self._table.setdefault(key.encode(), []).append(stream)
+        if stream.route_bare:
+            self._bare.append(stream)
+
+    def route(self, item: Any) -> List[DataStream]:
+        """Return the streams that consume a single item."""
+        sep = _SEPARATORS.get(type(item))
+        if sep is None:
+            return []
+        head, found, _ = item.partition(sep)
+        streams = self._table.get(head)
+        if streams is None:
+            return [] if found else self._bare
+        return streams
+
+    def split(self, data_batch: List[Any]) -> Dict[DataStream, List[Any]]:
+        """Return each registered stream's share of the batch."""
+        batches: Dict[DataStream, List[Any]] = {s: [] for s in self.streams}
+        targets = {
+            key: tuple(batches[s].append for s in streams)
+            for key, streams in self._table.items()
+        }
+        bare = tuple(batches[s].append for s in self._bare)
+        get = targets.get
+        separators = _SEPARATORS
+        for item in data_batch:
+            sep = separators.get(type(item))
+            if sep is None:
+                continue
+            head, split, _ = item.partition(sep)
+            found = get(head)
+            if found is None:
+                if split:
+                    continue
+                found = bare
+            for append in found:
+                append(item)
+        return batches
+
+
+class IngestMetrics:
+    """Live throughput and queue-depth figures of an async ingestion."""
+
+    def __init__(self, queues: Dict[DataStream, "asyncio.Queue[Any]"]) -> None:
+        self.items_in: int = 0
+        self.unrouted: int = 0
+        self.started: float = time.monotonic()
+        self.finished: Optional[float] = None
+        self.records: Dict[str, int] = {s.stream_id: 0 for s in queues}
+        self.batches: Dict[str, int] = {s.stream_id: 0 for s in queues}
+        self.max_depth: Dict[str, int] = {s.stream_id: 0 for s in queues}
+        self._queues = queues
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the ingestion started (until it finished)."""
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Items consumed from the source per second."""
+        elapsed = self.elapsed
+        return self.items_in / elapsed if elapsed > 0 else 0.0
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Current number of items waiting in each stream's queue."""
+        return {s.stream_id: q.qsize() for s, q in self._queues.items()}
+
+
+_END_OF_STREAM: Any = object()
+
+
+class InputSource(NamedTuple):
+    """Identity of the input file a checkpoint offset refers to.
+
+    tail_crc covers the CHECKPOINT_TAIL bytes before the offset, so a
+    file replaced, truncated or rewritten in place no longer matches,
+    while one that only grew by appends still does.
+    """
+
+    path: str
+    device: int
+    inode: int
+    tail_crc: int
+
+
+def _input_source(path: str, offset: int) -> InputSource:
+    """Identify path as it stands, fingerprinting the bytes before offset."""
+    with open(path, "rb") as handle:
+        info = os.fstat(handle.fileno())
+        start = max(0, offset - CHECKPOINT_TAIL)
+        handle.seek(start)
+        tail = handle.read(offset - start)
+    return InputSource(os.path.realpath(path), info.st_dev, info.st_ino,
+                       zlib.crc32(tail))
+
+
+class Checkpoint(NamedTuple):
+    """Saved stream totals, how much input produced them and from where."""
+
+    offset: int
+    totals: Dict[str, StreamAggregate]
+    source: Optional[InputSource] = None
 
 
 class StreamProcessor:
@@ -126,36 +1752,356 @@ class StreamProcessor:
 
     def __init__(self) -> None:
         self.streams: List[DataStream] = []
+        self.router: StreamRouter = StreamRouter()
+        self.ingest_metrics: Optional[IngestMetrics] = None
+        self.metrics: MetricsRegistry = MetricsRegistry()
 
     def add_stream(self, stream: DataStream) -> None:
         """Register a new stream."""
         self.streams.append(stream)
+        self.router.add(stream)
+        self.metrics.register(stream)
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Generates the polymorphic report for the Batch Results."""
-        results = []
-        for s in self.streams:
-            raw_report = s.process_batch(data_batch)
-            if isinstance(s, SensorStream):
-                name, count = "Sensor data", raw_report.split()[2]
-                unit = "readings"
-            elif isinstance(s, TransactionStream):
-                name, count = "Transaction data", raw_report.split()[2]
-                unit = "operations"
-            else:
-                name, count = "Event data", raw_report.split()[2]
-                unit = "events"
-            results.append(f" - {name}: {count} {unit} processed")
-        return "\n".join(results)
+    def process_batch(
+        self, data_batch: List[Any], criteria: Criteria = None
+    ) -> List[BatchReport]:
+        """Route a mixed batch once and return each stream's report.
+
+        Each report also carries the records matching criteria, found
+        while the stream parses its sub-batch; a preset name only
+        applies to the streams that define it.
+        """
+        routed = self.router.split(data_batch)
+        return [s.process_batch(routed[s], None,
+                                criteria if s.knows(criteria) else None)
+                for s in self.streams]
 
-    def filter_data(self, data_batch: List[Any], criteria: str) -> List[Any]:
-        """Consolidates filters from all streams."""
+    def filter_data(
+        self, data_batch: List[Any], criteria: Criteria
+    ) -> List[Any]:
+        """Consolidates filters from all streams.
+
+        A preset name only applies to the streams that define it; the
+        others contribute nothing instead of rejecting the name.
+        """
+        routed = self.router.split(data_batch)
         final_list = []
         for s in self.streams:
-            stream_alerts = s.filter_data(data_batch, criteria)
+            if not s.knows(criteria):
+                continue
+            stream_alerts = s.filter_data(routed[s], criteria)
             final_list.extend(stream_alerts)
         return final_list
 
+    async def ingest_async(
+        self,
+        source: AsyncIterable[Any],
+        queue_size: int = 1024,
+        max_batch: int = 256,
+        on_result: Optional[Callable[[DataStream, BatchReport], None]] = None
+    ) -> IngestMetrics:
+        """Consume an async iterator, one bounded queue per stream.
+
+        Each item is routed once and put on its stream's queue; a full
+        queue suspends the producer, so a slow stream applies
+        backpressure to the source. Every stream drains its queue in
+        micro-batches of up to max_batch items concurrently with the
+        others. on_result receives each micro-batch's report. The first
+        failure in the producer or any stream cancels the run and is
+        re-raised.
+        """
+        queues: Dict[DataStream, "asyncio.Queue[Any]"] = {
+            s: asyncio.Queue(maxsize=queue_size) for s in self.streams
+        }
+        metrics = IngestMetrics(queues)
+        self.ingest_metrics = metrics
+
+        async def produce() -> None:
+            async for item in source:
+                metrics.items_in += 1
+                targets = self.router.route(item)
+                if not targets:
+                    metrics.unrouted += 1
+                for stream in targets:
+                    queue = queues[stream]
+                    await queue.put(item)
+                    depth = queue.qsize()
+                    stream.metrics.queue_depth = depth
+                    if depth > metrics.max_depth[stream.stream_id]:
+                        metrics.max_depth[stream.stream_id] = depth
+            for queue in queues.values():
+                await queue.put(_END_OF_STREAM)
+
+        async def consume(stream: DataStream,
+                          queue: "asyncio.Queue[Any]") -> None:
+            done = False
+            while not done:
+                batch = [await queue.get()]
+                while len(batch) < max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                if batch[-1] is _END_OF_STREAM:
+                    batch.pop()
+                    done = True
+                if not batch:
+                    continue
+                stream.metrics.queue_depth = queue.qsize()
+                result = stream.process_batch(batch)
+                metrics.records[stream.stream_id] += len(batch)
+                metrics.batches[stream.stream_id] += 1
+                if on_result is not None:
+                    on_result(stream, result)
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume(s, q))
+                     for s, q in queues.items())
+        try:
+            finished, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in finished:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            metrics.finished = time.monotonic()
+        return metrics
+
+    def checkpoint(
+        self, path: str, offset: int, source: Optional[InputSource] = None
+    ) -> None:
+        """Atomically save every stream's totals and the input offset.
+
+        The file is a fixed header (magic, version, CRC-32 and payload
+        length) followed by the pickled aggregates, so its size and cost
+        follow the aggregates, not the input already consumed. source
+        records which input the offset belongs to.
+        """
+        state = Checkpoint(offset, {s.stream_id: s.totals
+                                    for s in self.streams}, source)
+        payload = pickle.dumps(tuple(state), pickle.HIGHEST_PROTOCOL)
+        header = _CHECKPOINT_HEADER.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, zlib.crc32(payload),
+            len(payload))
+        _write_atomic(path, header + payload)
+
+    def restore(self, path: str) -> int:
+        """Load totals saved by checkpoint and return the input offset.
+
+        Checkpoints are unpickled, so only load files this process
+        family wrote. Every registered stream must be present.
+        """
+        return self._apply_checkpoint(self._load_checkpoint(path))
+
+    def _apply_checkpoint(self, state: Checkpoint) -> int:
+        """Install a verified checkpoint's totals; return its offset."""
+        for stream in self.streams:
+            stream.totals = state.totals[stream.stream_id]
+        return state.offset
+
+    def _load_checkpoint(self, path: str) -> Checkpoint:
+        """Read and verify a checkpoint without applying it."""
+        with open(path, "rb") as handle:
+            header = handle.read(_CHECKPOINT_HEADER.size)
+            payload = handle.read()
+        if len(header) < _CHECKPOINT_HEADER.size:
+            raise ValueError(f"Truncated checkpoint: {path}")
+        magic, version, crc, size = _CHECKPOINT_HEADER.unpack(header)
+        if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+            raise ValueError(f"Not a version {CHECKPOINT_VERSION} "
+                             f"checkpoint: {path}")
+        if len(payload) != size or zlib.crc32(payload) != crc:
+            raise ValueError(f"Corrupt checkpoint: {path}")
+        state = Checkpoint(*pickle.loads(payload))
+        missing = [s.stream_id for s in self.streams
+                   if s.stream_id not in state.totals]
+        if missing:
+            raise ValueError(f"Checkpoint has no state for {missing}")
+        return state
+
+    def ingest_file(
+        self,
+        path: str,
+        checkpoint_path: Optional[str] = None,
+        every: int = 16,
+        batch_size: int = PARSE_CHUNK
+    ) -> int:
+        """Process a file of one record per line with resumable progress.
+
+        When checkpoint_path exists, totals are restored from it and
+        reading seeks straight past the bytes it already covers; a
+        checkpoint taken on a different input raises ValueError instead.
+        A new checkpoint is written every `every` batches and at the end.
+        Returns the number of records processed by this call.
+        """
+        offset = 0
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            state = self._load_checkpoint(checkpoint_path)
+            if state.source != _input_source(path, state.offset):
+                raise ValueError(f"Checkpoint {checkpoint_path} does not "
+                                 f"cover this input: {path}")
+            offset = self._apply_checkpoint(state)
+        processed = 0
+        pending = 0
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            lines = iter(handle)
+            while True:
+                raw = [line for _, line in zip(range(batch_size), lines)]
+                if not raw:
+                    break
+                offset += sum(map(len, raw))
+                chunk = [line.decode("utf-8", "replace").rstrip("\r\n")
+                         for line in raw]
+                routed = self.router.split(chunk)
+                for stream in self.streams:
+                    if routed[stream]:
+                        stream._ingest(routed[stream])
+                processed += len(chunk)
+                pending += 1
+                if checkpoint_path is not None and pending >= every:
+                    self.checkpoint(checkpoint_path, offset,
+                                    _input_source(path, offset))
+                    pending = 0
+        if checkpoint_path is not None:
+            self.checkpoint(checkpoint_path, offset,
+                            _input_source(path, offset))
+        return processed
+
+    def process_sharded(
+        self, data_batch: List[Any], workers: Optional[int] = None
+    ) -> Dict[str, StreamAggregate]:
+        """Aggregate a large batch across a process pool.
+
+        The batch is cut into one slice per worker; each worker routes
+        and aggregates its slice and sends back only the per-stream
+        aggregates, which are merged and folded into every stream's
+        totals. Returns the merged aggregate of this batch per stream.
+        """
+        started = time.perf_counter_ns()
+        workers = workers or os.cpu_count() or 1
+        spec = self._shard_spec()
+        if workers <= 1 or len(data_batch) < 2 * PARSE_CHUNK:
+            return self._absorb([_summarize_shard(spec, data_batch)],
+                                started)
+        step = -(-len(data_batch) // workers)
+        slices = [data_batch[i:i + step]
+                  for i in range(0, len(data_batch), step)]
+        with ProcessPoolExecutor(max_workers=len(slices)) as pool:
+            partials = list(pool.map(_summarize_shard,
+                                     [spec] * len(slices), slices))
+        return self._absorb(partials, started)
+
+    def process_file_sharded(
+        self, path: str, workers: Optional[int] = None
+    ) -> Dict[str, StreamAggregate]:
+        """Aggregate a file of one record per line across a process pool.
+
+        The file is split into newline-aligned byte ranges, so workers
+        read their own share and no record crosses a process boundary.
+        """
+        started = time.perf_counter_ns()
+        workers = workers or os.cpu_count() or 1
+        spec = self._shard_spec()
+        size = os.path.getsize(path)
+        step = max(1, -(-size // workers))
+        starts = list(range(0, size, step)) or [0]
+        ends = [min(start + step, size) for start in starts]
+        if len(starts) == 1:
+            return self._absorb(
+                [_summarize_file_range(spec, path, 0, size)], started)
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            n = len(starts)
+            partials = list(pool.map(_summarize_file_range, [spec] * n,
+                                     [path] * n, starts, ends))
+        return self._absorb(partials, started)
+
+    def _shard_spec(self) -> List[Tuple[type, str, Dict[str, Any]]]:
+        """Picklable recipe for rebuilding the streams in a worker."""
+        return [(type(s), s.stream_id, s.shard_options())
+                for s in self.streams]
+
+    def _absorb(
+        self, partials: List[List[StreamAggregate]], started: int
+    ) -> Dict[str, StreamAggregate]:
+        """Merge worker partials and fold them into the stream totals."""
+        merged = [s.new_aggregate() for s in self.streams]
+        for partial in partials:
+            for total, part in zip(merged, partial):
+                total.merge(part)
+        elapsed = time.perf_counter_ns() - started
+        for stream, total in zip(self.streams, merged):
+            stream.totals.merge(total)
+            stream.metrics.observe(total, total.records + total.rejected,
+                                   elapsed)
+        return {s.stream_id: total for s, total in zip(self.streams, merged)}
+
+
+def _build_processor(
+    spec: List[Tuple[type, str, Dict[str, Any]]]
+) -> StreamProcessor:
+    """Recreate a processor's streams from a shard spec."""
+    processor = StreamProcessor()
+    for stream_type, stream_id, options in spec:
+        processor.add_stream(stream_type(stream_id, **options))
+    return processor
+
+
+def _summarize_shard(
+    spec: List[Tuple[type, str, Dict[str, Any]]], data_batch: List[Any]
+) -> List[StreamAggregate]:
+    """Worker: route and aggregate one slice of a batch."""
+    processor = _build_processor(spec)
+    routed = processor.router.split(data_batch)
+    return [s.summarize(routed[s]) for s in processor.streams]
+
+
+def _lines_before(handle: Any, end: int) -> Iterator[str]:
+    """Yield decoded lines of a binary file that start before end."""
+    pos = handle.tell()
+    for line in handle:
+        if pos >= end:
+            break
+        pos += len(line)
+        yield line.decode("utf-8", "replace").rstrip("\r\n")
+
+
+def _summarize_file_range(
+    spec: List[Tuple[type, str, Dict[str, Any]]],
+    path: str,
+    start: int,
+    end: int
+) -> List[StreamAggregate]:
+    """Worker: aggregate the records that start inside [start, end).
+
+    Chunks merge as exact aggregates; event names are sketched once per
+    shard rather than once per chunk.
+    """
+    processor = _build_processor(spec)
+    exact: List[Any] = [None] * len(processor.streams)
+    with open(path, "rb") as handle:
+        if start > 0:
+            handle.seek(start - 1)
+            handle.readline()
+        lines = _lines_before(handle, end)
+        while True:
+            chunk = [line for _, line in zip(range(SHARD_LINES), lines)]
+            if not chunk:
+                break
+            routed = processor.router.split(chunk)
+            for index, stream in enumerate(processor.streams):
+                part = stream._aggregate(routed[stream])[0]
+                if exact[index] is None:
+                    exact[index] = part
+                else:
+                    exact[index].merge(part)
+    totals = []
+    for stream, counts in zip(processor.streams, exact):
+        total = stream.new_aggregate()
+        if counts is not None:
+            total.merge(counts)
+        totals.append(total)
+    return totals
+
 
 if __name__ == "__main__":
     print("=== CODE NEXUS - POLYMORPHIC STREAM SYSTEM ===")
@@ -196,10 +2142,11 @@ if __name__ == "__main__":
     ]
 
     print("\nBatch 1 Results:")
-    print(nexus.process_batch(mixed_input))
+    print(render_reports(nexus.process_batch(mixed_input)))
 
     print("\nStream filtering active: High-priority data only")
     filtered_res = nexus.filter_data(mixed_input, "critical")
-    print(f"Filtered results: {', '.join(filtered_res)}")
+    print(f"Filtered results: {len(filtered_res)} critical records "
+          f"({', '.join(filtered_res)})")
 
     print("\nAll streams processed successfully. Nexus throughput optimal.")
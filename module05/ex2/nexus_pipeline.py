@@ -1,7 +1,30 @@
 """Module for Enterprise Pipeline Integration in the Code Nexus."""
 
+import csv
+import math
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+import traceback
 from abc import ABC, abstractmethod
-from typing import Any, List, Union, Protocol, runtime_checkable
+from array import array
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+)
+from enum import Enum
+from itertools import chain, islice
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+    Sequence, Set, Tuple, Union, Protocol, runtime_checkable
+)
+
+Fused = Tuple[Callable[[Any], Any], Callable[[Iterable[Any]], List[Any]]]
+Segment = Callable[[Iterator[Any]], Iterator[Any]]
+POLL_SECONDS: float = 0.1
+CSV_CHUNK_ROWS: int = 8192
+CSV_SAMPLE_ROWS: int = 256
 
 
 @runtime_checkable
@@ -13,6 +36,43 @@ class ProcessingStage(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingStage(Protocol):
+    """Protocol for stages that transform the whole record stream.
+
+    process_stream may drop, expand or aggregate records; it must pull
+    from its input lazily so pipelines run in constant memory.
+    """
+
+    def process_stream(self, items: Iterator[Any]) -> Iterator[Any]:
+        """Yield output records from an iterator of input records."""
+        ...
+
+
+def _collapse(outputs: List[Any]) -> Any:
+    """Single-record result of a stream: one output, None or a list."""
+    if not outputs:
+        return None
+    return outputs[0] if len(outputs) == 1 else outputs
+
+
+class GeneratorStage:
+    """Stage built from a generator function over the record stream."""
+
+    def __init__(
+        self, transform: Callable[[Iterator[Any]], Iterator[Any]]
+    ) -> None:
+        self.transform = transform
+
+    def process_stream(self, items: Iterator[Any]) -> Iterator[Any]:
+        """Apply the transform lazily."""
+        return self.transform(items)
+
+    def process(self, data: Any) -> Any:
+        """Run one record: its only output, None if dropped, else a list."""
+        return _collapse(list(self.transform(iter((data,)))))
+
+
 class InputStage:
     """Stage 1: Input validation and parsing."""
 
@@ -43,16 +103,322 @@ class OutputStage:
         return data
 
 
+def fuse_stages(stages: Sequence[ProcessingStage]) -> Fused:
+    """Compile stages into fused per-record and per-batch callables.
+
+    Each stage's process method is bound once into a tuple that a plain
+    closure walks, so a record costs one call per stage and no lookups.
+    """
+    steps = tuple(s.process for s in stages)
+
+    def one(x: Any) -> Any:
+        for step in steps:
+            x = step(x)
+        return x
+
+    def many(items: Iterable[Any]) -> List[Any]:
+        return list(map(one, items))
+
+    return one, many
+
+
+def _mapped(run: Callable[[Any], Any]) -> Segment:
+    """Lazily apply a per-record function to a stream."""
+    def segment(items: Iterator[Any]) -> Iterator[Any]:
+        return map(run, items)
+    return segment
+
+
+def stream_segments(stages: Sequence[ProcessingStage]) -> List[Segment]:
+    """Group stages into iterator-to-iterator segments.
+
+    Runs of per-record stages are fused into a single map; streaming
+    stages contribute their own process_stream.
+    """
+    segments: List[Segment] = []
+    plain: List[ProcessingStage] = []
+    for stage in stages:
+        if isinstance(stage, StreamingStage):
+            if plain:
+                segments.append(_mapped(fuse_stages(plain)[0]))
+                plain = []
+            segments.append(stage.process_stream)
+        else:
+            plain.append(stage)
+    if plain:
+        segments.append(_mapped(fuse_stages(plain)[0]))
+    return segments
+
+
+class StageError(RuntimeError):
+    """A pipelined stage (or the input feed) raised; see __cause__."""
+
+    def __init__(self, stage: int, error: BaseException, trace: str) -> None:
+        where = "input feed" if stage < 0 else f"stage {stage}"
+        super().__init__(f"Pipeline {where} failed: {error!r}")
+        self.stage: int = stage
+        self.trace: str = trace
+
+
+class _Failure:
+    """Picklable report of an error, forwarded down the queues."""
+
+    def __init__(self, stage: int, error: BaseException) -> None:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(repr(error))
+        self.stage: int = stage
+        self.error: BaseException = error
+        self.trace: str = traceback.format_exc()
+
+
+class _Stopped(Exception):
+    """The pipeline is shutting down."""
+
+
+class _Forward(Exception):
+    """An upstream failure arrived in the inbox."""
+
+    def __init__(self, failure: _Failure) -> None:
+        super().__init__(failure.error)
+        self.failure: _Failure = failure
+
+
+def _put(outbox: Any, message: Any, stop: Any) -> None:
+    """Put on a bounded queue, giving up once stop is set."""
+    while True:
+        try:
+            outbox.put(message, timeout=POLL_SECONDS)
+            return
+        except queue.Full:
+            if stop.is_set():
+                raise _Stopped()
+
+
+def _read(
+    inbox: Any,
+    stop: Any,
+    alive: Optional[Callable[[], bool]] = None
+) -> Iterator[Any]:
+    """Yield records from chunk messages until the end-of-stream None."""
+    while True:
+        try:
+            message = inbox.get(timeout=POLL_SECONDS)
+        except queue.Empty:
+            if stop.is_set():
+                raise _Stopped()
+            if alive is not None and not alive():
+                raise RuntimeError("A pipeline worker process died")
+            continue
+        if message is None:
+            return
+        if isinstance(message, _Failure):
+            raise _Forward(message)
+        yield from message
+
+
+def _chunked(records: Iterable[Any], outbox: Any, stop: Any,
+             chunk_size: int) -> None:
+    """Send records downstream in lists of chunk_size, then None."""
+    chunk: List[Any] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            _put(outbox, chunk, stop)
+            chunk = []
+    if chunk:
+        _put(outbox, chunk, stop)
+    _put(outbox, None, stop)
+
+
+def _run_worker(stage: int, records: Callable[[], Iterable[Any]],
+                outbox: Any, stop: Any, chunk_size: int) -> None:
+    """Drive one worker, forwarding any failure instead of dying."""
+    try:
+        _chunked(records(), outbox, stop, chunk_size)
+    except _Stopped:
+        return
+    except _Forward as forward:
+        failure = forward.failure
+    except BaseException as error:
+        failure = _Failure(stage, error)
+    else:
+        return
+    try:
+        _put(outbox, failure, stop)
+    except _Stopped:
+        pass
+
+
+def _feed_worker(items: Iterable[Any], outbox: Any, stop: Any,
+                 chunk_size: int) -> None:
+    """Worker: read the source iterable into the first queue."""
+    _run_worker(-1, lambda: items, outbox, stop, chunk_size)
+
+
+def _stage_worker(index: int, stage: ProcessingStage, inbox: Any,
+                  outbox: Any, stop: Any, chunk_size: int) -> None:
+    """Worker: run one stage between its inbox and outbox."""
+    def records() -> Iterable[Any]:
+        upstream = _read(inbox, stop)
+        if isinstance(stage, StreamingStage):
+            return stage.process_stream(upstream)
+        return map(stage.process, upstream)
+    _run_worker(index, records, outbox, stop, chunk_size)
+
+
 class ProcessingPipeline(ABC):
-    """Abstract base managing stages and orchestrating data flow."""
+    """Abstract base managing stages and orchestrating data flow.
+
+    The stage list is compiled into one fused callable whenever a stage
+    is added, so it is only exposed read-only; pickling drops the fused
+    closures and rebuilds them on load.
+    """
 
     def __init__(self, pipeline_id: str) -> None:
         self.pipeline_id: str = pipeline_id
-        self.stages: List[ProcessingStage] = []
+        self._stages: List[ProcessingStage] = []
+        self._compile()
+
+    @property
+    def stages(self) -> Tuple[ProcessingStage, ...]:
+        """Configured stages in order; use add_stage to extend."""
+        return tuple(self._stages)
+
+    def _compile(self) -> None:
+        """Rebuild the fused execution paths from the stage list."""
+        self._segments = stream_segments(self._stages)
+        self._streaming = any(isinstance(s, StreamingStage)
+                              for s in self._stages)
+        fused: Fused
+        if self._streaming:
+            fused = self._process_one, self._drain
+        else:
+            fused = fuse_stages(self._stages)
+        self._run, self._run_batch = fused
 
     def add_stage(self, stage: ProcessingStage) -> None:
         """Configure stages for the pipeline."""
-        self.stages.append(stage)
+        self._stages.append(stage)
+        self._compile()
+
+    def process_batch(self, batch: Iterable[Any]) -> List[Any]:
+        """Run every record of a batch through the fused stages."""
+        return self._run_batch(batch)
+
+    def _process_one(self, data: Any) -> Any:
+        """Single record through streaming stages, collapsed."""
+        return _collapse(self._drain((data,)))
+
+    def _drain(self, items: Iterable[Any]) -> List[Any]:
+        """Every output of streaming stages for a finite input."""
+        return list(self.process_stream(items))
+
+    def process_stream(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Lazily run an unbounded iterable through every stage.
+
+        Nothing is read until the result is iterated, and only the
+        records in flight are held, so memory does not grow with input.
+        """
+        stream: Iterator[Any] = iter(items)
+        for segment in self._segments:
+            stream = segment(stream)
+        return stream
+
+    def process_pipelined(
+        self,
+        items: Iterable[Any],
+        processes: Iterable[int] = (),
+        queue_size: int = 16,
+        chunk_size: int = 256
+    ) -> Iterator[Any]:
+        """Run every stage in its own worker, linked by bounded queues.
+
+        Stages run as threads, except those whose index is in processes,
+        which run in child processes (the stage must be picklable). The
+        source is read by a feeder thread. Records move in chunks of
+        chunk_size and each queue holds at most queue_size chunks, so a
+        slow stage holds back the ones before it while all stages work
+        at once; throughput tends toward that of the slowest stage.
+
+        Output order is preserved. The first failure anywhere stops the
+        pipeline and is raised here as StageError; closing the iterator
+        early also stops every worker. An unknown stage index in
+        processes raises ValueError right away, before any worker runs.
+        """
+        in_process = set(processes)
+        if not in_process <= set(range(len(self._stages))):
+            raise ValueError(f"No such stage among {sorted(in_process)}")
+        return self._pipelined(items, in_process, queue_size, chunk_size)
+
+    def _pipelined(
+        self,
+        items: Iterable[Any],
+        in_process: Set[int],
+        queue_size: int,
+        chunk_size: int
+    ) -> Iterator[Any]:
+        """Start the workers of process_pipelined and yield its output.
+
+        Child processes are started before any thread, so no fork
+        happens while another thread may hold a lock.
+        """
+        if in_process:
+            context = multiprocessing.get_context()
+            stop: Any = context.Event()
+            queues: List[Any] = [context.Queue(queue_size)
+                                 for _ in range(len(self._stages) + 1)]
+        else:
+            stop = threading.Event()
+            queues = [queue.Queue(queue_size)
+                      for _ in range(len(self._stages) + 1)]
+        threads: List[threading.Thread] = [threading.Thread(
+            target=_feed_worker, daemon=True,
+            args=(items, queues[0], stop, chunk_size))]
+        children: List[Any] = []
+        for index, stage in enumerate(self._stages):
+            args = (index, stage, queues[index], queues[index + 1], stop,
+                    chunk_size)
+            if index in in_process:
+                children.append(context.Process(
+                    target=_stage_worker, args=args, daemon=True))
+            else:
+                threads.append(threading.Thread(target=_stage_worker,
+                                                args=args, daemon=True))
+        workers: List[Any] = children + threads
+
+        def alive() -> bool:
+            return all(c.exitcode in (None, 0) for c in children)
+
+        for worker in workers:
+            worker.start()
+        try:
+            yield from _read(queues[-1], stop, alive)
+        except _Forward as forward:
+            failure = forward.failure
+            raise StageError(failure.stage, failure.error,
+                             failure.trace) from failure.error
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join(timeout=1.0)
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+            if in_process:
+                for channel in queues:
+                    channel.cancel_join_thread()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for compiled in ("_run", "_run_batch", "_segments", "_streaming"):
+            del state[compiled]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compile()
 
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
@@ -65,21 +431,175 @@ class JSONAdapter(ProcessingPipeline):
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process data through all stages."""
-        current = data
-        for stage in self.stages:
-            current = stage.process(current)
-        return current
+        return self._run(data)
+
+
+class CSVSchema(NamedTuple):
+    """Column names and their types (int, float or str)."""
+
+    names: Tuple[str, ...]
+    types: Tuple[type, ...]
+
+
+class ColumnBatch(NamedTuple):
+    """A chunk of CSV rows stored column by column.
+
+    int columns are array('q') and float columns array('d') with NaN for
+    empty fields; str columns, and int columns holding empty fields or
+    values that do not fit 64 bits, are lists.
+    """
+
+    schema: CSVSchema
+    columns: Dict[str, Union[array, List[Any]]]
+    rows: int
+
+
+def _infer_type(values: Iterable[str]) -> type:
+    """Narrowest of int, float and str that parses every sample value."""
+    kind: type = int
+    for value in values:
+        if not value:
+            continue
+        if kind is int:
+            try:
+                int(value)
+                continue
+            except ValueError:
+                kind = float
+        try:
+            float(value)
+        except ValueError:
+            return str
+    return kind
+
+
+def _converter(kind: type) -> Callable[[str], Any]:
+    """Field parser for a column type; empty numeric fields are None."""
+    if kind is str:
+        return str
+
+    def convert(value: str) -> Any:
+        return kind(value) if value else None
+    return convert
+
+
+def _to_columns(rows: List[Tuple[Any, ...]], schema: CSVSchema) -> ColumnBatch:
+    """Transpose a chunk of typed rows into compact columns."""
+    columns: Dict[str, Union[array, List[Any]]] = {}
+    for name, kind, values in zip(schema.names, schema.types, zip(*rows)):
+        if kind is float:
+            columns[name] = array("d", [math.nan if v is None else v
+                                        for v in values])
+            continue
+        if kind is int and None not in values:
+            try:
+                columns[name] = array("q", values)
+                continue
+            except OverflowError:
+                pass
+        columns[name] = list(values)
+    return ColumnBatch(schema, columns, len(rows))
 
 
 class CSVAdapter(ProcessingPipeline):
-    """Adapter for CSV data processing."""
+    """Adapter for CSV data processing.
+
+    Besides single records, it streams CSV files of any size: rows are
+    parsed lazily by the csv module in chunks, typed once per file and
+    fed to the stages as tuples or as columnar batches, so memory stays
+    bounded by the chunk size rather than the file size.
+    """
+
+    def __init__(self, pipeline_id: str) -> None:
+        super().__init__(pipeline_id)
+        self.schema: Optional[CSVSchema] = None
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process data through all stages."""
-        current = data
-        for stage in self.stages:
-            current = stage.process(current)
-        return current
+        return self._run(data)
+
+    def read_chunks(
+        self,
+        path: str,
+        types: Optional[Dict[str, type]] = None,
+        has_header: bool = True,
+        chunk_rows: int = CSV_CHUNK_ROWS,
+        encoding: str = "utf-8",
+        delimiter: str = ","
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        """Yield lists of up to chunk_rows typed row tuples.
+
+        Declared types win; other columns are inferred from the first
+        CSV_SAMPLE_ROWS rows. The schema is set on self.schema once the
+        first chunk is read. A field that does not parse as its column
+        type, or a row of the wrong width, raises ValueError.
+        """
+        with open(path, newline="", encoding=encoding) as handle:
+            reader = csv.reader(handle, delimiter=delimiter)
+            header = next(reader, None) if has_header else None
+            sample = list(islice(reader, CSV_SAMPLE_ROWS))
+            if header is not None:
+                names = tuple(header)
+            else:
+                width = len(sample[0]) if sample else 0
+                names = tuple(f"column_{i}" for i in range(width))
+            declared = types or {}
+            unknown = set(declared) - set(names)
+            if unknown:
+                raise ValueError(f"{path}: no columns named "
+                                 f"{sorted(unknown)}")
+            kinds = tuple(
+                declared.get(name) or _infer_type(
+                    row[i] for row in sample if len(row) > i)
+                for i, name in enumerate(names)
+            )
+            self.schema = CSVSchema(names, kinds)
+            converters = [_converter(kind) for kind in kinds]
+            width = len(names)
+            chunk: List[Tuple[Any, ...]] = []
+            for number, row in enumerate(chain(sample, reader), 1):
+                if len(row) != width:
+                    if not row:
+                        continue
+                    raise ValueError(f"{path}: row {number} has {len(row)} "
+                                     f"fields, expected {width}")
+                try:
+                    chunk.append(tuple([convert(value) for convert, value
+                                        in zip(converters, row)]))
+                except ValueError:
+                    raise ValueError(f"{path}: row {number} does not match "
+                                     f"{self.schema}") from None
+                if len(chunk) >= chunk_rows:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    def process_file(
+        self,
+        path: str,
+        columnar: bool = False,
+        types: Optional[Dict[str, type]] = None,
+        has_header: bool = True,
+        chunk_rows: int = CSV_CHUNK_ROWS,
+        encoding: str = "utf-8",
+        delimiter: str = ","
+    ) -> Iterator[Any]:
+        """Lazily run a CSV file through the stages.
+
+        Stages receive one tuple per row or, when columnar, one
+        ColumnBatch per chunk of rows.
+        """
+        chunks = self.read_chunks(path, types, has_header, chunk_rows,
+                                  encoding, delimiter)
+        if not columnar:
+            return self.process_stream(chain.from_iterable(chunks))
+
+        def batches() -> Iterator[ColumnBatch]:
+            for chunk in chunks:
+                if self.schema is not None:
+                    yield _to_columns(chunk, self.schema)
+        return self.process_stream(batches())
 
 
 class StreamAdapter(ProcessingPipeline):
@@ -87,10 +607,42 @@ class StreamAdapter(ProcessingPipeline):
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process data through all stages."""
-        current = data
-        for stage in self.stages:
-            current = stage.process(current)
-        return current
+        return self._run(data)
+
+
+class ExecutorKind(str, Enum):
+    """Where NexusManager.run_all executes pipelines."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class PipelineResult(NamedTuple):
+    """Outcome of one pipeline run; error is None on success."""
+
+    pipeline_id: str
+    output: Any
+    duration: float
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the pipeline finished without error."""
+        return self.error is None
+
+
+def _timed_process(
+    pipeline: ProcessingPipeline, data: Any
+) -> PipelineResult:
+    """Worker: run one pipeline and measure it where it runs."""
+    started = time.perf_counter()
+    try:
+        output = pipeline.process(data)
+    except Exception as error:
+        return PipelineResult(pipeline.pipeline_id, None,
+                              time.perf_counter() - started, error)
+    return PipelineResult(pipeline.pipeline_id, output,
+                          time.perf_counter() - started, None)
 
 
 class NexusManager:
@@ -103,11 +655,67 @@ class NexusManager:
         """Register a pipeline."""
         self.pipelines.append(pipeline)
 
-    def run_all(self, data_list: List[Any]) -> None:
-        """Run each pipeline with corresponding data."""
-        for i, pipe in enumerate(self.pipelines):
-            result = pipe.process(data_list[i])
-            print(f"Output: {result}")
+    def _inputs(
+        self, data: Union[List[Any], Dict[str, Any]]
+    ) -> List[Any]:
+        """Pair every pipeline with its input, by id or by position."""
+        if isinstance(data, dict):
+            missing = [p.pipeline_id for p in self.pipelines
+                       if p.pipeline_id not in data]
+            if missing:
+                raise ValueError(f"No input for pipelines {missing}")
+            return [data[p.pipeline_id] for p in self.pipelines]
+        if len(data) < len(self.pipelines):
+            raise ValueError(f"{len(self.pipelines)} pipelines but only "
+                             f"{len(data)} inputs")
+        return list(data[:len(self.pipelines)])
+
+    def run_all(
+        self,
+        data: Union[List[Any], Dict[str, Any]],
+        executor: ExecutorKind = ExecutorKind.THREAD,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None
+    ) -> List[PipelineResult]:
+        """Run every pipeline concurrently and collect their results.
+
+        data maps pipeline ids to inputs, or is a list paired with the
+        pipelines by position. Pipelines run on a thread pool, or on a
+        process pool for CPU-bound work (pipelines and inputs must then
+        be picklable). A pipeline still running timeout seconds after
+        the start gets a TimeoutError result; it is abandoned, not
+        killed. Results follow the order of registration.
+        """
+        inputs = self._inputs(data)
+        if not self.pipelines:
+            return []
+        workers = max_workers or len(self.pipelines)
+        pool: Executor
+        if executor is ExecutorKind.PROCESS:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        started = time.perf_counter()
+        results: List[PipelineResult] = []
+        try:
+            futures: List[Future[PipelineResult]] = [
+                pool.submit(_timed_process, pipe, item)
+                for pipe, item in zip(self.pipelines, inputs)
+            ]
+            for pipe, future in zip(self.pipelines, futures):
+                remaining = None
+                if timeout is not None:
+                    remaining = max(0.0, started + timeout
+                                    - time.perf_counter())
+                try:
+                    results.append(future.result(remaining))
+                except Exception as error:
+                    results.append(PipelineResult(
+                        pipe.pipeline_id, None,
+                        time.perf_counter() - started, error))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
 
 
 if __name__ == "__main__":